@@ -12,9 +12,17 @@ from .drp_agent import DRPAgent
 LOGGER = StructuredLogger("gatekeeper")
 
 
-def gates_green(lock: CapitalLock, ops: OpsAgent, drp: DRPAgent) -> bool:
-    """Return ``True`` if all agent gates allow execution."""
-    if kill_switch_triggered():
+def gates_green(
+    lock: CapitalLock, ops: OpsAgent, drp: DRPAgent, *, kill_switch: bool | None = None
+) -> bool:
+    """Return ``True`` if all agent gates allow execution.
+
+    ``kill_switch`` lets a caller that already checked the switch this tick
+    pass the result instead of re-checking the flag file.
+    """
+    if kill_switch is None:
+        kill_switch = kill_switch_triggered()
+    if kill_switch:
         LOGGER.log("kill_switch", risk_level="high")
         return False
     if os.getenv("OPS_CRITICAL_EVENT") == "1":
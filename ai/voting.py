@@ -11,7 +11,7 @@ import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import asyncio
 
@@ -56,12 +56,76 @@ class MutationProposal:
     created_at: str
     expires_at: str
     status: ProposalStatus
-    votes: List[Vote]
     quorum_required: int
     approval_threshold: float
     risk_level: str
     audit_results: Optional[Dict] = None
     execution_tx: Optional[str] = None
+    # Votes are stored column-wise so quorum checks only scan ``vote_types``.
+    voter_ids: List[str] = field(default_factory=list)
+    vote_types: List[str] = field(default_factory=list)
+    timestamps: List[str] = field(default_factory=list)
+    signatures: List[str] = field(default_factory=list)
+    reasons: List[Optional[str]] = field(default_factory=list)
+    risk_assessments: List[Optional[Dict]] = field(default_factory=list)
+
+    @property
+    def votes(self) -> List[Vote]:
+        """Return votes as :class:`Vote` objects rebuilt from the columns."""
+        return [
+            Vote(voter_id, VoteType(vote_type), ts, sig, reason, risk)
+            for voter_id, vote_type, ts, sig, reason, risk in zip(
+                self.voter_ids,
+                self.vote_types,
+                self.timestamps,
+                self.signatures,
+                self.reasons,
+                self.risk_assessments,
+            )
+        ]
+
+    def add_vote(self, vote: Vote) -> None:
+        """Append ``vote`` to the column storage."""
+        self.voter_ids.append(vote.voter_id)
+        self.vote_types.append(VoteType(vote.vote_type).value)
+        self.timestamps.append(vote.timestamp)
+        self.signatures.append(vote.signature)
+        self.reasons.append(vote.reason)
+        self.risk_assessments.append(vote.risk_assessment)
+
+    def to_dict(self) -> Dict:
+        """Return a JSON-serializable dict using the on-disk ``votes`` layout."""
+        pdict = {
+            "proposal_id": self.proposal_id,
+            "strategy_id": self.strategy_id,
+            "mutation_type": self.mutation_type,
+            "mutation_data": self.mutation_data,
+            "proposer": self.proposer,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+            "status": self.status.value,
+            "quorum_required": self.quorum_required,
+            "approval_threshold": self.approval_threshold,
+            "risk_level": self.risk_level,
+            "audit_results": self.audit_results,
+            "execution_tx": self.execution_tx,
+        }
+        pdict["votes"] = [
+            {**asdict(v), "vote_type": v.vote_type.value}
+            for v in self.votes
+        ]
+        return pdict
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MutationProposal":
+        """Build a proposal from the on-disk layout written by :meth:`to_dict`."""
+        data = dict(data)
+        votes = data.pop("votes", [])
+        data["status"] = ProposalStatus(data["status"])
+        proposal = cls(**data)
+        for v in votes:
+            proposal.add_vote(Vote(**v))
+        return proposal
 
 
 class VotingQuorum:
@@ -91,16 +155,16 @@ class VotingQuorum:
         
         self.proposals_file = self.vote_storage / "proposals.json"
         self.proposals = self._load_proposals()
+        # set once a pending proposal is approved or rejected; see wait_for_quorum
+        self._quorum_events: Dict[str, asyncio.Event] = {}
     
     def _load_authorized_voters(self) -> Set[str]:
         """Load authorized voter IDs from configuration."""
-        voters = set()
-        
-        # From environment variables
-        for i in range(1, 10):
-            voter = os.getenv(f"AUTHORIZED_VOTER_{i}")
-            if voter:
-                voters.add(voter)
+        # From environment variables (AUTHORIZED_VOTER_1, AUTHORIZED_VOTER_2, ...)
+        voters = {
+            v for k, v in os.environ.items()
+            if k.startswith("AUTHORIZED_VOTER_") and v
+        }
         
         # From config file
         config_file = Path("config/authorized_voters.json")
@@ -120,28 +184,15 @@ class VotingQuorum:
         if self.proposals_file.exists():
             with open(self.proposals_file) as f:
                 data = json.load(f)
-                proposals = {}
-                for pid, pdata in data.items():
-                    # Convert to dataclass
-                    votes = [Vote(**v) for v in pdata.pop("votes", [])]
-                    pdata["votes"] = votes
-                    pdata["status"] = ProposalStatus(pdata["status"])
-                    proposals[pid] = MutationProposal(**pdata)
-                return proposals
+                return {
+                    pid: MutationProposal.from_dict(pdata)
+                    for pid, pdata in data.items()
+                }
         return {}
     
     def _save_proposals(self):
         """Save proposals to storage."""
-        data = {}
-        for pid, proposal in self.proposals.items():
-            pdict = asdict(proposal)
-            # Convert enums to strings
-            pdict["status"] = proposal.status.value
-            pdict["votes"] = [
-                {**asdict(v), "vote_type": v.vote_type.value}
-                for v in proposal.votes
-            ]
-            data[pid] = pdict
+        data = {pid: proposal.to_dict() for pid, proposal in self.proposals.items()}
         
         with open(self.proposals_file, "w") as f:
             json.dump(data, f, indent=2)
@@ -197,7 +248,6 @@ class VotingQuorum:
             created_at=now.isoformat(),
             expires_at=(now + timedelta(hours=self.vote_timeout_hours)).isoformat(),
             status=ProposalStatus.PENDING,
-            votes=[],
             quorum_required=self.quorum_threshold,
             approval_threshold=self.approval_percentage,
             risk_level=risk_level,
@@ -247,7 +297,7 @@ class VotingQuorum:
             return False
         
         # Check if already voted
-        if any(v.voter_id == voter_id for v in proposal.votes):
+        if voter_id in proposal.voter_ids:
             raise ValueError(f"Voter {voter_id} already voted")
         
         # Create vote
@@ -266,7 +316,7 @@ class VotingQuorum:
             raise ValueError("Invalid vote signature")
         
         # Add vote
-        proposal.votes.append(vote)
+        proposal.add_vote(vote)
         
         # Check if quorum reached
         self._check_quorum(proposal)
@@ -280,7 +330,7 @@ class VotingQuorum:
             voter_id=voter_id,
             vote_type=vote_type.value,
             reason=reason,
-            current_votes=len(proposal.votes),
+            current_votes=len(proposal.vote_types),
             quorum_required=proposal.quorum_required
         )
         
@@ -291,11 +341,11 @@ class VotingQuorum:
         if proposal.status != ProposalStatus.PENDING:
             return
         
-        total_votes = len(proposal.votes)
+        total_votes = len(proposal.vote_types)
         
         if total_votes >= proposal.quorum_required:
             # Count approvals
-            approvals = sum(1 for v in proposal.votes if v.vote_type == VoteType.APPROVE)
+            approvals = proposal.vote_types.count(VoteType.APPROVE.value)
             approval_rate = approvals / total_votes
             
             if approval_rate >= proposal.approval_threshold:
@@ -319,6 +369,10 @@ class VotingQuorum:
                     total_votes=total_votes,
                     approval_rate=approval_rate
                 )
+            
+            event = self._quorum_events.pop(proposal.proposal_id, None)
+            if event is not None:
+                event.set()
     
     def _schedule_execution(self, proposal: MutationProposal):
         """Schedule approved proposal for execution."""
@@ -336,11 +390,13 @@ class VotingQuorum:
                 "risk_level": proposal.risk_level,
                 "votes": [
                     {
-                        "voter": v.voter_id,
-                        "vote": v.vote_type.value,
-                        "reason": v.reason
+                        "voter": voter_id,
+                        "vote": vote_type,
+                        "reason": reason
                     }
-                    for v in proposal.votes
+                    for voter_id, vote_type, reason in zip(
+                        proposal.voter_ids, proposal.vote_types, proposal.reasons
+                    )
                 ]
             }, f, indent=2)
         
@@ -385,18 +441,23 @@ class VotingQuorum:
         return {
             "proposal_id": proposal_id,
             "status": proposal.status.value,
-            "votes_received": len(proposal.votes),
+            "votes_received": len(proposal.vote_types),
             "quorum_required": proposal.quorum_required,
             "approval_threshold": proposal.approval_threshold,
             "expires_at": proposal.expires_at,
             "votes": [
                 {
-                    "voter": v.voter_id,
-                    "vote": v.vote_type.value,
-                    "timestamp": v.timestamp,
-                    "reason": v.reason
+                    "voter": voter_id,
+                    "vote": vote_type,
+                    "timestamp": ts,
+                    "reason": reason
                 }
-                for v in proposal.votes
+                for voter_id, vote_type, ts, reason in zip(
+                    proposal.voter_ids,
+                    proposal.vote_types,
+                    proposal.timestamps,
+                    proposal.reasons,
+                )
             ],
             "can_execute": proposal.status == ProposalStatus.APPROVED
         }
@@ -437,6 +498,23 @@ class VotingQuorum:
         proposal = self.proposals[proposal_id]
         return proposal.status in [ProposalStatus.APPROVED, ProposalStatus.EXECUTED]
     
+    async def wait_for_quorum(self, proposal_id: str, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a vote to decide the proposal.
+
+        Wakes as soon as :meth:`cast_vote` approves or rejects it instead of
+        polling; returns :meth:`quorum_met` afterwards.
+        """
+        proposal = self.proposals.get(proposal_id)
+        if proposal is not None and proposal.status == ProposalStatus.PENDING:
+            event = self._quorum_events.get(proposal_id)
+            if event is None:
+                event = self._quorum_events[proposal_id] = asyncio.Event()
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.quorum_met(proposal_id)
+    
     def get_pending_proposals(self) -> List[Dict]:
         """Get all pending proposals requiring votes."""
         pending = []
@@ -452,7 +530,7 @@ class VotingQuorum:
                         "strategy_id": proposal.strategy_id,
                         "mutation_type": proposal.mutation_type,
                         "risk_level": proposal.risk_level,
-                        "votes_needed": proposal.quorum_required - len(proposal.votes),
+                        "votes_needed": proposal.quorum_required - len(proposal.vote_types),
                         "expires_in_hours": (
                             datetime.fromisoformat(proposal.expires_at) - 
                             datetime.now(timezone.utc)
@@ -479,7 +557,7 @@ class VotingQuorum:
             archive_dir.mkdir(parents=True, exist_ok=True)
             
             with open(archive_dir / f"{pid}.json", "w") as f:
-                json.dump(asdict(self.proposals[pid]), f, indent=2)
+                json.dump(self.proposals[pid].to_dict(), f, indent=2)
             
             del self.proposals[pid]
         
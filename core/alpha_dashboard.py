@@ -42,10 +42,14 @@ class AlphaDashboard:
             data["orchestrator"] = self.orchestrator.status()
         strategies = getattr(self.orchestrator, "strategies", {})
         for sid, strat in strategies.items():
+            # one pass over the trade history instead of three
+            pnl = 0.0
+            wins = 0
             trades = getattr(strat.capital_lock, "trades", [])
-            pnl = sum(trades)
-            wins = sum(1 for t in trades if t > 0)
-            losses = sum(1 for t in trades if t <= 0)
+            for t in trades:
+                pnl += t
+                wins += t > 0
+            losses = len(trades) - wins
             pools = [cfg.pool for cfg in getattr(strat, "pools", {}).values()]
             stealth = strat.edges_enabled.get("stealth_mode", False)
             data["strategies"][sid] = {
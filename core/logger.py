@@ -5,7 +5,7 @@ Module purpose and system role:
     - Emits JSON lines for Prometheus and AI audit ingestion.
 
 Integration points and dependencies:
-    - Minimal dependencies (standard library only).
+    - Minimal dependencies (standard library; ``orjson`` when installed).
     - Other modules instantiate ``StructuredLogger`` to record events.
 
 Simulation/test hooks and kill conditions:
@@ -15,9 +15,14 @@ Simulation/test hooks and kill conditions:
 
 from __future__ import annotations
 
+import atexit
+import io
 import json
 from datetime import datetime, timezone
 import os
+import queue
+import threading
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, cast
 
@@ -39,15 +44,63 @@ try:  # optional dependency
 except Exception:  # pragma: no cover - optional
     requests = cast(Any, None)
 
-try:  # structured logging optional
-    import structlog  # type: ignore
+try:  # faster JSON encoding when available
+    import orjson  # type: ignore
 except Exception:  # pragma: no cover - optional
-    structlog = None  # type: ignore
+    orjson = None  # type: ignore
 
-if structlog is not None:  # pragma: no cover - optional
-    _JSON_RENDERER = structlog.processors.JSONRenderer()
-else:
-    _JSON_RENDERER = None
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values the encoder cannot serialize natively."""
+
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return f"<{value.__class__.__name__}>"
+
+
+if orjson is not None:
+    _ORJSON_OPTS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+def _dumps(entry: Dict[str, Any]) -> bytes:
+    """Return the newline-terminated JSON line for ``entry``.
+
+    Unsupported leaves go through :func:`_json_default`, so no pre-pass over
+    the entry is needed in the common case.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=_json_default, option=_ORJSON_OPTS)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; stdlib json handles those
+    try:
+        return (json.dumps(entry, default=_json_default) + "\n").encode()
+    except (TypeError, ValueError):  # unsupported dict keys
+        return (json.dumps(make_json_safe(entry)) + "\n").encode()
+
+
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return ``datetime.now(timezone.utc).isoformat()`` cheaply.
+
+    The seconds prefix is formatted once per second and shared; only the
+    microsecond suffix is rendered per call.
+    """
+
+    global _TS_CACHE
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{rem // 1000:06d}+00:00"
 
 
 def _error_log_file() -> Path:
@@ -56,6 +109,50 @@ def _error_log_file() -> Path:
     return Path(os.getenv("ERROR_LOG_FILE", "logs/errors.log"))
 
 
+# error storms: at most _ERR_BURST identical errors are written per window;
+# the rest are counted and reported as ``repeated`` on the next written one
+_ERR_WINDOW = 1.0
+_ERR_BURST = int(os.getenv("ERROR_LOG_BURST", "10"))
+_ERR_BUCKETS: Dict[tuple[str, str, str], List[float]] = {}
+_ERR_LOCK = threading.Lock()
+
+
+def _sample_error(key: tuple[str, str, str]) -> int | None:
+    """Return suppressed repeats to report for ``key``, or ``None`` to drop."""
+
+    if _ERR_BURST <= 0:
+        return 0
+    now = time.monotonic()
+    with _ERR_LOCK:
+        bucket = _ERR_BUCKETS.get(key)  # [window_start, written, suppressed]
+        if bucket is None or now - bucket[0] >= _ERR_WINDOW:
+            if bucket is None and len(_ERR_BUCKETS) >= 1024:
+                for k, b in list(_ERR_BUCKETS.items()):
+                    if now - b[0] >= _ERR_WINDOW and not b[2]:
+                        del _ERR_BUCKETS[k]
+            _ERR_BUCKETS[key] = [now, 1, 0]
+            return int(bucket[2]) if bucket else 0
+        if bucket[1] < _ERR_BURST:
+            bucket[1] += 1
+            return 0
+        bucket[2] += 1
+        return None
+
+
+def _open_append(path: Path) -> io.BufferedWriter:
+    """Open ``path`` for appending, creating its directory only if missing.
+
+    The directory almost always exists already, so try the open first rather
+    than paying a ``mkdir`` syscall on every write.
+    """
+
+    try:
+        return path.open("ab")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("ab")
+
+
 def log_error(
     module: str,
     error: str,
@@ -68,14 +165,25 @@ def log_error(
     trace_id: str | None = None,
     **extra: Any,
 ) -> None:
-    """Write structured error entry to ``logs/errors.log``."""
+    """Write structured error entry to ``logs/errors.log``.
+
+    Bursts of the same error are sampled (``ERROR_LOG_BURST`` per second,
+    ``0`` disables); the error metric still counts every call.
+    """
 
+    from core import metrics as _metrics
+    _metrics.record_error()
+
+    path = _error_log_file()
+    repeated = _sample_error((str(path), module, error[:64]))
+    if repeated is None:
+        return
     if trace_id is None:
         trace_id = os.getenv("TRACE_ID", "")
     if block is None:
         block = os.getenv("BLOCK", "")
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
         "module": module,
         "error": error,
         "tx_id": tx_id,
@@ -86,51 +194,358 @@ def log_error(
         "trace_id": trace_id,
         **extra,
     }
-    path = _error_log_file()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    safe = make_json_safe(entry)
-    line = json.dumps(safe)
-    if _JSON_RENDERER is not None:
+    if repeated:
+        entry["repeated"] = repeated
+    with _open_append(path) as fh:
+        fh.write(_dumps(entry))
+
+
+# immutable snapshot swapped under _HOOKS_LOCK; log() iterates it lock-free
+_HOOKS: tuple[Callable[[Dict[str, Any]], None], ...] = ()
+_HOOKS_LOCK = threading.Lock()
+_ALERT_WEBHOOKS = [w for w in os.getenv("OPS_ALERT_WEBHOOK", "").split(",") if w]
+
+
+# alerts are posted by a daemon thread so a slow webhook never blocks log()
+_ALERT_Q: "queue.Queue[str]" = queue.Queue(maxsize=1024)
+_ALERT_THREAD: threading.Thread | None = None
+_ALERT_START_LOCK = threading.Lock()
+
+
+_ALERT_SESSION: Any = None
+
+
+def _alert_session() -> Any:
+    """Return the pooled HTTP session; only the alert thread calls this."""
+
+    global _ALERT_SESSION
+    if _ALERT_SESSION is None:
+        session_cls = getattr(requests, "Session", None)
+        if session_cls is None:
+            return requests
+        session = session_cls()
         try:
-            line = _JSON_RENDERER(None, None, safe)
-        except Exception:
-            line = json.dumps(safe)
-    with path.open("a") as fh:
-        fh.write(line + "\n")
+            from requests.adapters import HTTPAdapter  # type: ignore
 
-    from core import metrics as _metrics
-    _metrics.record_error()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        except Exception:  # pragma: no cover - optional
+            pass
+        _ALERT_SESSION = session
+    return _ALERT_SESSION
 
 
-_HOOKS: List[Callable[[Dict[str, Any]], None]] = []
-_ALERT_WEBHOOKS = [w for w in os.getenv("OPS_ALERT_WEBHOOK", "").split(",") if w]
+def _post_alert(message: str) -> None:
+    for url in _ALERT_WEBHOOKS:
+        try:  # pragma: no cover - network
+            _alert_session().post(url, json={"text": message}, timeout=5)
+        except Exception:
+            pass
+
+
+def _alert_worker() -> None:
+    while True:
+        _post_alert(_ALERT_Q.get())
 
 
 def _send_alert(message: str) -> None:
+    global _ALERT_THREAD
     if not _ALERT_WEBHOOKS or requests is None:
         return
-    for url in _ALERT_WEBHOOKS:
-        try:  # pragma: no cover - network
-            requests.post(url, json={"text": message}, timeout=5)
-        except Exception:
+    if _ALERT_THREAD is None:
+        with _ALERT_START_LOCK:
+            if _ALERT_THREAD is None:
+                thread = threading.Thread(
+                    target=_alert_worker, name="ops-alert-sender", daemon=True
+                )
+                thread.start()
+                _ALERT_THREAD = thread
+    while True:
+        try:
+            _ALERT_Q.put_nowait(message)
+            return
+        except queue.Full:  # drop the oldest pending alert
+            try:
+                _ALERT_Q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - platform
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+def _writev_all(fd: int, lines: List[bytes]) -> None:
+    """Append ``lines`` with one ``writev(2)`` per ``IOV_MAX`` buffers."""
+
+    if not hasattr(os, "writev"):  # pragma: no cover - non-POSIX
+        _write_all(fd, b"".join(lines))
+        return
+    for start in range(0, len(lines), _IOV_MAX):
+        chunk = lines[start:start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        total = sum(map(len, chunk))
+        if written < total:  # short write: finish the remainder
+            _write_all(fd, b"".join(chunk)[written:])
+
+
+# opt-in: tests and tools that read log files right after ``log()`` rely on
+# the synchronous default
+_ASYNC_LOG = os.getenv("MEVOG_ASYNC_LOG", "0") == "1"
+# entries drained per writer wake-up, and how long a partial batch may wait
+# for more lines before it is written
+_LOG_BATCH = int(os.getenv("MEVOG_LOG_BATCH", "512"))
+_LOG_LINGER = float(os.getenv("MEVOG_LOG_LINGER_MS", "0")) / 1000
+# size at which a log file is renamed aside and a fresh one started (0 = never)
+_LOG_MAX_BYTES = int(os.getenv("MEVOG_LOG_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+def _rotate_file(path: Path, fd: int) -> None:
+    """Rename ``path`` to ``path.<utc time>`` if ``fd`` still refers to it.
+
+    Another writer may already have rotated the file; then only the caller's
+    descriptor needs reopening.
+    """
+
+    try:
+        if os.stat(path).st_ino != os.fstat(fd).st_ino:
+            return
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        os.rename(path, f"{path}.{stamp}")
+    except FileNotFoundError:
+        pass
+
+
+class _LogWriter:
+    """Background thread appending queued log entries to their files."""
+
+    def __init__(
+        self, max_batch: int = _LOG_BATCH, linger: float = _LOG_LINGER
+    ) -> None:
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._fds: Dict[Path, int] = {}
+        self._sizes: Dict[Path, int] = {}
+        self._idents: Dict[Path, tuple[int, int]] = {}
+        self._max_batch = max(1, max_batch)
+        self._linger = linger
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, item: tuple[Path, bytes]) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put(item)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every entry submitted so far has been written."""
+
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    # ------------------------------------------------------------------
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._run, name="structured-log-writer", daemon=True
+            )
+            thread.start()
+            self._thread = thread
+            atexit.register(self.flush)
+
+    def _fd(self, path: Path) -> int:
+        """Return the descriptor for the file currently at ``path``.
+
+        Like :meth:`StructuredLogger._file`, reopens once the path points at
+        a different file, e.g. after a synchronous logger rotated it.
+        """
+        fd = self._fds.get(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+        if fd is not None and st is not None and (st.st_ino, st.st_dev) == self._idents[path]:
+            self._sizes[path] = st.st_size
+            return fd
+        self._close(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644
+        )
+        st = os.fstat(fd)
+        self._fds[path] = fd
+        self._idents[path] = (st.st_ino, st.st_dev)
+        self._sizes[path] = st.st_size
+        return fd
+
+    def _close(self, path: Path) -> None:
+        fd = self._fds.pop(path, None)
+        self._sizes.pop(path, None)
+        self._idents.pop(path, None)
+        if fd is not None:
+            os.close(fd)
+
+    def _drain(self, batch: List[Any]) -> None:
+        get_nowait = self._queue.get_nowait
+        try:
+            while len(batch) < self._max_batch:
+                batch.append(get_nowait())
+        except queue.Empty:
             pass
 
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            batch = [get()]
+            self._drain(batch)
+            if self._linger and len(batch) < self._max_batch:
+                # let a burst accumulate so it costs one write per file
+                time.sleep(self._linger)
+                self._drain(batch)
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        pending: Dict[Path, List[bytes]] = {}
+        markers: List[threading.Event] = []
+        for item in batch:
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                continue
+            path, line = item
+            pending.setdefault(path, []).append(line)
+        for path, lines in pending.items():
+            try:
+                fd = self._fd(path)
+                _writev_all(fd, lines)
+                size = self._sizes[path] = self._sizes[path] + sum(map(len, lines))
+                if _LOG_MAX_BYTES and size >= _LOG_MAX_BYTES:
+                    _rotate_file(path, fd)
+                    self._close(path)
+            except OSError as exc:
+                self._close(path)
+                log_error("logger", f"write failed for {path}: {exc}")
+        for marker in markers:
+            marker.set()
+
+
+_WRITER = _LogWriter()
+
+
+def flush_logs(timeout: float | None = 5.0) -> bool:
+    """Wait for queued asynchronous log entries to reach disk."""
+
+    return _WRITER.flush(timeout)
+
+
+def append_json_line(
+    path: str | Path, entry: Dict[str, Any], *, async_write: bool | None = None
+) -> None:
+    """Append ``entry`` as one JSON line to ``path``.
+
+    With ``MEVOG_ASYNC_LOG=1`` (or ``async_write=True``) the line goes through
+    the shared background writer, batched with other log output; otherwise it
+    is written before returning.
+    """
+
+    path = Path(os.path.abspath(path))
+    line = _dumps(entry)
+    if _ASYNC_LOG if async_write is None else async_write:
+        _WRITER.submit((path, line))
+        return
+    with _open_append(path) as fh:
+        fh.write(line)
+
 
 def register_hook(func: Callable[[Dict[str, Any]], None]) -> None:
     """Register ``func`` to receive every log entry."""
-    _HOOKS.append(func)
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = _HOOKS + (func,)
 
 
 class StructuredLogger:
     """Write structured JSON logs to file and broadcast to hooks."""
 
-    def __init__(self, module: str, log_file: str | None = None) -> None:
+    def __init__(
+        self,
+        module: str,
+        log_file: str | None = None,
+        *,
+        async_write: bool | None = None,
+    ) -> None:
         self.module = module
+        self.async_write = _ASYNC_LOG if async_write is None else async_write
         if log_file is None:
             env_var = f"{module.upper()}_LOG"
             log_file = os.getenv(env_var, f"logs/{module}.json")
         self.path = Path(log_file)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: io.FileIO | None = None
+        # (st_ino, st_dev) of the open file, compared against the path per write
+        self._ident: tuple[int, int] = (0, 0)
+        self._size = 0
+        # constant part of every line, spliced in front of the varying fields
+        self._prefix = b'{"module":' + json.dumps(module).encode() + b","
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        """Re-read ``TRACE_ID``/``BLOCK`` defaults, e.g. on config reload."""
+
+        self._env_trace = os.getenv("TRACE_ID", "")
+        self._env_block = os.getenv("BLOCK", "")
+
+    # ------------------------------------------------------------------
+    def _file(self) -> io.FileIO:
+        """Return the handle for the file currently at ``self.path``.
+
+        One ``stat`` per write notices the file being renamed or removed
+        (logrotate, ``mv``, ``unlink``, another logger's rotation) and reopens,
+        which still costs far less than opening the file for every line.
+        """
+        fh = self._fh
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        if fh is not None and st is not None and (st.st_ino, st.st_dev) == self._ident:
+            self._size = st.st_size
+            return fh
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # unbuffered: each line is a single O_APPEND write, visible at once
+        fh = self._fh = open(self.path, "ab", buffering=0)
+        st = os.fstat(fh.fileno())
+        self._ident = (st.st_ino, st.st_dev)
+        self._size = st.st_size
+        return fh
+
+    def close(self) -> None:
+        """Close the cached log file handle."""
+
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            fh.close()
+
+    def reopen(self) -> None:
+        """Reopen the log file now; writes also reopen it after a rotation."""
+
+        self.close()
+        self._file()
 
     # ------------------------------------------------------------------
     def log(
@@ -146,36 +561,65 @@ class StructuredLogger:
         trace_id: str | None = None,
         **extra: Any,
     ) -> None:
-        """Append log entry to file and send to hooks."""
+        """Append log entry to file and send to hooks.
+
+        With ``async_write`` the entry is handed to the background writer
+        and reaches disk after :func:`flush_logs`; hooks still run on the
+        calling thread. Optional fields left at their empty defaults are
+        omitted from the entry to keep log lines small.
+        """
 
         if trace_id is None:
-            trace_id = os.getenv("TRACE_ID", "")
+            trace_id = self._env_trace
         if block is None:
-            block = os.getenv("BLOCK", "")
+            block = self._env_block
         entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
             "event": event,
-            "module": self.module,
-            "tx_id": tx_id,
-            "strategy_id": strategy_id,
-            "mutation_id": mutation_id,
-            "risk_level": risk_level,
-            "block": block,
-            "error": error,
-            "trace_id": trace_id,
         }
-        entry.update(extra)
-        safe_entry = make_json_safe(entry)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        line = json.dumps(safe_entry)
-        if _JSON_RENDERER is not None:
+        # optional schema fields are only emitted when set; readers use .get()
+        if tx_id:
+            entry["tx_id"] = tx_id
+        if strategy_id:
+            entry["strategy_id"] = strategy_id
+        if mutation_id:
+            entry["mutation_id"] = mutation_id
+        if risk_level:
+            entry["risk_level"] = risk_level
+        if block != "":
+            entry["block"] = block
+        if error is not None:
+            entry["error"] = error
+        if trace_id:
+            entry["trace_id"] = trace_id
+        if extra:
+            entry.update(extra)
+        prefix = self._prefix
+        if "module" in entry:  # caller overrode the module field via extra
+            entry = {"module": self.module, **entry}
+            prefix = b"{"
+        # encoded on the caller so queued lines cannot see later mutations
+        line = prefix + _dumps(entry)[1:]
+        if self.async_write:
+            _WRITER.submit((self.path, line))
+        else:
             try:
-                line = _JSON_RENDERER(None, None, safe_entry)
-            except Exception:
-                line = json.dumps(safe_entry)
-        with self.path.open("a") as fh:
-            fh.write(line + "\n")
-        for hook in list(_HOOKS):
+                self._file().write(line)
+            except (OSError, ValueError):
+                self.reopen()
+                self._file().write(line)
+            self._size += len(line)
+            if _LOG_MAX_BYTES and self._size >= _LOG_MAX_BYTES and self._fh is not None:
+                # _size was read from the shared file, so any logger on this
+                # path may rotate it; the others reopen on their next write
+                _rotate_file(self.path, self._fh.fileno())
+                self.close()
+        hooks = _HOOKS
+        if hooks:
+            safe_entry = make_json_safe(entry)
+            if prefix is self._prefix:
+                safe_entry = {"module": self.module, **safe_entry}
+        for hook in hooks:
             try:
                 hook(safe_entry)
             except Exception as exc:
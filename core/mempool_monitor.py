@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, cast
+import asyncio
+from typing import Any, Iterable, List, NamedTuple, cast
 
 from agents.ops_agent import OpsAgent
 try:
@@ -18,19 +19,61 @@ try:
 except Exception:  # pragma: no cover - optional
     Web3 = cast(Any, None)
 
+try:  # push-based mempool feed (web3 >= 6.10)
+    from web3 import AsyncWeb3, WebsocketProviderV2
+except Exception:  # pragma: no cover - optional
+    AsyncWeb3 = WebsocketProviderV2 = cast(Any, None)
+
 LOG = StructuredLogger("mempool_monitor")
 
 
+class BridgeTx(NamedTuple):
+    """Fields of a pending bridge transaction used downstream."""
+
+    hash: bytes
+    to: str
+    input: bytes
+    value: int
+    gas_price: int
+
+
+def _bridge_tx(tx: Any) -> BridgeTx:
+    return BridgeTx(
+        tx["hash"],
+        tx["to"],
+        tx.get("input", b""),
+        tx.get("value", 0),
+        tx.get("gasPrice") or tx.get("maxFeePerGas", 0),
+    )
+
+
 class MempoolMonitor:
     """Monitor pending transactions for bridge activity."""
 
     def __init__(
-        self, web3: Web3 | None, *, ops_agent: OpsAgent | None = None, fail_threshold: int = 3
+        self,
+        web3: Web3 | None,
+        *,
+        ops_agent: OpsAgent | None = None,
+        fail_threshold: int = 3,
+        bridge_addrs: Iterable[str] | None = None,
+        ws_url: str | None = None,
     ) -> None:
         self.web3 = web3
+        self.ws_url = ws_url
         self.ops_agent = ops_agent
         self.fail_threshold = fail_threshold
         self.failures = 0
+        # empty set keeps the old behaviour of accepting any tx with a ``to``
+        self.bridges: frozenset[str] = frozenset(a.lower() for a in bridge_addrs or ())
+
+    def _is_bridge_tx(self, tx: Any) -> bool:
+        if not tx:
+            return False
+        to = tx.get("to")
+        if not to:
+            return False
+        return not self.bridges or str(to).lower() in self.bridges
 
     def _alert(self, event: str, err: Exception) -> None:
         self.failures += 1
@@ -38,20 +81,30 @@ class MempoolMonitor:
         if self.ops_agent:
             self.ops_agent.notify(f"mempool_monitor:{event}:{err}")
 
+    def _fetch_transactions(self, hashes: List[Any]) -> List[Any]:
+        """Return pending transactions for ``hashes``.
+
+        One ``eth_getTransactionByHash`` per hash; use
+        :meth:`listen_bridge_txs_ws` to avoid the lookups entirely.
+        """
+        assert self.web3 is not None
+        eth = self.web3.eth
+        return [eth.get_transaction(HexBytes(cast(bytes, h))) for h in hashes]
+
     def listen_bridge_txs(
         self, limit: int = 10, *, simulate_failure: str | None = None
-    ) -> List[Dict[str, object]]:
+    ) -> List[BridgeTx]:
         """Return a list of pending bridge transactions up to ``limit``."""
         if self.web3 is None:
             return []
-        results: List[Dict[str, object]] = []
+        results: List[BridgeTx] = []
         try:
             if simulate_failure == "network":
                 raise RuntimeError("sim net")
             if simulate_failure == "rpc":
                 raise ValueError("sim rpc")
             if simulate_failure == "data_poison":
-                return [{"bad": True}]
+                return [BridgeTx(b"", "", b"", -1, -1)]
             if simulate_failure == "downtime":
                 raise RuntimeError("sim 503")
 
@@ -59,10 +112,11 @@ class MempoolMonitor:
             count = 0
             while count < limit:
                 hashes = filt.get_new_entries()
-                for h in hashes:
-                    tx = self.web3.eth.get_transaction(HexBytes(cast(bytes, h)))
-                    if tx and tx.get("to"):
-                        results.append(dict(tx))
+                if not hashes:
+                    continue
+                for tx in self._fetch_transactions(hashes):
+                    if self._is_bridge_tx(tx):
+                        results.append(_bridge_tx(tx))
                         count += 1
                         if count >= limit:
                             break
@@ -70,3 +124,48 @@ class MempoolMonitor:
             self._alert("mempool_fail", exc)
             return []
         return results
+
+    def pending_bridge_txs(self, limit: int = 10) -> List[BridgeTx]:
+        """Return up to ``limit`` pending bridge txs, websocket first.
+
+        With ``ws_url`` set the node pushes transactions; if that yields
+        nothing (no websocket support, connection failure) or the caller is
+        already inside an event loop, fall back to HTTP polling.
+        """
+        if self.ws_url and AsyncWeb3 is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                results = asyncio.run(self.listen_bridge_txs_ws(self.ws_url, limit))
+                if results:
+                    return results
+        return self.listen_bridge_txs(limit)
+
+    async def listen_bridge_txs_ws(
+        self, ws_url: str, limit: int = 10
+    ) -> List[BridgeTx]:
+        """Return up to ``limit`` pending bridge txs pushed over a websocket.
+
+        Subscribes to ``newPendingTransactions`` with full transaction
+        bodies, so no polling or per-hash ``get_transaction`` round trips are
+        needed. Nodes that only push hashes are handled with a lookup per
+        hash. Use :meth:`listen_bridge_txs` when only HTTP RPC is available.
+        """
+        if AsyncWeb3 is None:
+            return []
+        results: List[BridgeTx] = []
+        try:
+            async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(ws_url)) as w3:
+                await w3.eth.subscribe("newPendingTransactions", True)
+                async for msg in w3.ws.process_subscriptions():
+                    tx = msg.get("result")
+                    if isinstance(tx, (str, bytes)):  # node pushed a hash only
+                        tx = await w3.eth.get_transaction(tx)
+                    if self._is_bridge_tx(tx):
+                        results.append(_bridge_tx(tx))
+                        if len(results) >= limit:
+                            break
+        except Exception as exc:  # pragma: no cover - network errors
+            self._alert("mempool_ws_fail", exc)
+            return []
+        return results
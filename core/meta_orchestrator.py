@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import copy
+import heapq
 import random
+from concurrent.futures import ThreadPoolExecutor, wait
+from types import TracebackType
 from typing import Any, Dict, Type
 
 from core.logger import StructuredLogger
@@ -20,30 +24,47 @@ class MetaOrchestrator:
         self.nonce_manager = get_shared_nonce_manager()
         self.active_agents: Dict[int, Any] = {}
         self.pruned_agents: list[int] = []
+        self._next_aid = 0
+        # run_once is RPC-bound; see _spawn_agents for what agents share
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(8, num_agents), thread_name_prefix="meta-agent"
+        )
         self.logger = StructuredLogger("meta_orchestrator")
         self._spawn_agents(self.num_agents)
 
     # --------------------------------------------------------------
     def _spawn_agents(self, n: int) -> None:
+        base = self.base_params
+        base_threshold = base.get("threshold", 0.003)
         for _ in range(n):
-            params = self.base_params.copy()
-            params["threshold"] = params.get("threshold", 0.003) * (0.9 + 0.2 * random.random())
-            params["nonce_manager"] = self.nonce_manager
-            aid = max(self.active_agents.keys(), default=-1) + 1
+            # agents run concurrently: each gets its own copy of plain
+            # containers (pools, config); other objects such as the nonce
+            # manager or a CapitalLock are shared and must be thread-safe
+            params = {
+                **{
+                    k: copy.deepcopy(v) if isinstance(v, (dict, list, set)) else v
+                    for k, v in base.items()
+                },
+                "threshold": base_threshold * (0.9 + 0.2 * random.random()),
+                "nonce_manager": self.nonce_manager,
+            }
+            aid = self._next_aid
+            self._next_aid += 1
             agent = self.strategy_cls(**params)
             self.active_agents[aid] = agent
             log_mutation("spawn_variant", agent_id=aid, params=params)
 
     # --------------------------------------------------------------
     def run_cycle(self) -> None:
-        for agent in self.active_agents.values():
-            try:
-                agent.run_once()
-            except Exception:
-                continue
-        scores = {aid: getattr(agent, "evaluate_pnl", lambda: 0.0)() for aid, agent in self.active_agents.items()}
-        keep = sorted(scores, key=lambda aid: scores[aid], reverse=True)[: max(1, self.num_agents // 2)]
-        pruned = [aid for aid in list(self.active_agents) if aid not in keep]
+        # agent failures are swallowed as before: wait() does not re-raise
+        wait([self._pool.submit(agent.run_once) for agent in self.active_agents.values()])
+        scores = {
+            aid: agent.evaluate_pnl() if hasattr(agent, "evaluate_pnl") else 0.0
+            for aid, agent in self.active_agents.items()
+        }
+        # top-k selection; same ordering as sorted(..., reverse=True)[:k]
+        keep = set(heapq.nlargest(max(1, self.num_agents // 2), scores, key=scores.__getitem__))
+        pruned = [aid for aid in self.active_agents if aid not in keep]
         for aid in pruned:
             log_mutation("pruned_agent", agent_id=aid, pnl=scores.get(aid, 0.0), reason="low_performance")
             self.pruned_agents.append(aid)
@@ -52,6 +73,23 @@ class MetaOrchestrator:
             self._spawn_agents(len(pruned))
         self.logger.log("cycle", active=list(self.active_agents), pruned=pruned)
 
+    # --------------------------------------------------------------
+    def close(self) -> None:
+        """Shut down the agent worker pool."""
+
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "MetaOrchestrator":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     # --------------------------------------------------------------
     def status(self) -> Dict[str, Any]:
         return {"active_agents": list(self.active_agents), "pruned_agents": self.pruned_agents}
@@ -5,7 +5,8 @@ Module purpose and system role:
     - Provide an HTTP ``/metrics`` endpoint consumable by Prometheus.
 
 Integration points and dependencies:
-    - Uses ``http.server`` from the standard library; no external deps.
+    - Serves HTTP with ``asyncio`` from the standard library; no external deps.
+    - ``prometheus_client`` collectors, when installed, are served alongside.
     - Strategies call update functions to modify metric counters.
 
 Simulation/test hooks and kill conditions:
@@ -15,9 +16,14 @@ Simulation/test hooks and kill conditions:
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import itertools
 import os
+from collections import deque
+import socket
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
 try:
     from prometheus_client import (
         Counter as PCounter,
@@ -32,36 +38,157 @@ except Exception:  # pragma: no cover - optional
     def start_http_server(*_a: object, **_k: object) -> None:  # type: ignore
         pass
 from core.tx_engine.kill_switch import kill_switch_triggered, record_kill_event
-from statistics import mean
-from typing import Any, Dict, List, cast
-
-
-_METRICS: Dict[str, Any] = {
-    "opportunities": 0,
-    "fails": 0,
-    "pnl": 0.0,
-    "spreads": [],
-    "latencies": [],
-    "alert_count": 0,
-    "strategy_scores": {},
-    "prune_total": 0,
-    "decay_alerts": 0,
-    "mutation_events": 0,
-    "opportunities_found": 0,
-    "arb_profit": 0.0,
-    "arb_latency": [],
-    "error_count": 0,
-    "abort_total": 0,
-    "kill_events": 0,
-    "drp_anomalies": 0,
-}
+from typing import Dict, List, cast
+
+
+class _Counter:
+    """Integer counter updated without a lock.
+
+    ``next()`` on an ``itertools.count`` is a single C call and therefore
+    atomic under the GIL. Reads consume one tick of ``_incs`` and are
+    balanced by ``_reads``; they must be serialized (scrapes hold ``_LOCK``).
+    """
+
+    __slots__ = ("_incs", "_reads")
+
+    def __init__(self) -> None:
+        self._incs = itertools.count()
+        self._reads = itertools.count()
+
+    def inc(self) -> None:
+        next(self._incs)
+
+    @property
+    def value(self) -> int:
+        return next(self._incs) - next(self._reads)
+
+
+_WINDOW = int(os.getenv("METRICS_WINDOW", "4096"))
+
+
+class _Window:
+    """Mean over the last ``size`` samples in O(1) per update and read."""
+
+    __slots__ = ("values", "total", "_adds")
+
+    def __init__(self, size: int = _WINDOW) -> None:
+        self.values: deque[float] = deque(maxlen=size)
+        self.total = 0.0
+        self._adds = 0
+
+    def add(self, value: float) -> None:
+        values = self.values
+        if len(values) == values.maxlen:
+            self.total -= values[0]
+        values.append(value)
+        self.total += value
+        self._adds += 1
+        if self._adds == values.maxlen:  # shed accumulated rounding drift
+            self._adds = 0
+            self.total = sum(values)
+
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+
+class _Shard:
+    """Per-thread float accumulators for :func:`record_opportunity`.
+
+    Only the owning thread writes a shard; scrapes merge all shards. A read
+    racing an update may see one sample half-applied, which only skews that
+    single scrape. Shards of finished threads are folded into a retired one.
+    """
+
+    __slots__ = ("pnl", "arb_profit", "spreads", "latencies", "arb_latency", "thread")
+
+    def __init__(self, thread: threading.Thread | None = None) -> None:
+        self.pnl = 0.0
+        self.arb_profit = 0.0
+        # spreads/latencies keep a bounded window with a running sum:
+        # constant memory and O(1) averages however long the process runs
+        self.spreads = _Window()
+        self.latencies = _Window()
+        self.arb_latency = _Window()
+        self.thread = thread
+
+    def absorb(self, other: "_Shard") -> None:
+        self.pnl += other.pnl
+        self.arb_profit += other.arb_profit
+        for name in ("spreads", "latencies", "arb_latency"):
+            window = getattr(self, name)
+            for value in getattr(other, name).values:
+                window.add(value)
+
+
+class _Metrics:
+    """Custom metric state read and updated by attribute.
+
+    Slot attributes spare the ``record_*`` helpers a string hash and dict
+    probe per update; ``strategy_scores`` stays a dict keyed by strategy and
+    ``score_lines`` holds each score's pre-encoded exposition line.
+    """
+
+    __slots__ = (
+        "opportunities",
+        "fails",
+        "alert_count",
+        "prune_total",
+        "decay_alerts",
+        "mutation_events",
+        "opportunities_found",
+        "error_count",
+        "abort_total",
+        "kill_events",
+        "drp_anomalies",
+        "strategy_scores",
+        "score_lines",
+    )
+
+    def __init__(self) -> None:
+        self.opportunities = _Counter()
+        self.fails = _Counter()
+        self.alert_count = _Counter()
+        self.prune_total = _Counter()
+        self.decay_alerts = _Counter()
+        self.mutation_events = _Counter()
+        self.opportunities_found = _Counter()
+        self.error_count = _Counter()
+        self.abort_total = _Counter()
+        self.kill_events = _Counter()
+        self.drp_anomalies = _Counter()
+        self.strategy_scores: Dict[str, float] = {}
+        self.score_lines: Dict[str, bytes] = {}
+
+
+_METRICS = _Metrics()
+# _LOCK serializes snapshots/reset; updates are lock-free: integer counters
+# are ``_Counter`` objects, float accumulators live in per-thread shards and
+# strategy scores are single dict stores
 _LOCK = threading.Lock()
+_TLS = threading.local()
+_SHARDS: list[_Shard] = []
+_SHARDS_LOCK = threading.Lock()
+_RETIRED = _Shard()
 _METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+# bumped by every update; the rendered body is reused while the version is
+# unchanged and rebuilt at most once per _CACHE_TTL seconds otherwise
+_VERSION = _Counter()
+_CACHE_TTL = float(os.getenv("METRICS_CACHE_TTL", "1.0"))
+_BODY_CACHE: tuple[int, float, bytes] = (-1, 0.0, b"")
+# last (plain, gzipped) pair so an unchanged body is compressed only once
+_GZIP_CACHE: tuple[bytes, bytes] = (b"", gzip.compress(b"", compresslevel=1))
 
 if PCounter is not None:
     PROM_ARB_FOUND = PCounter("arb_opportunities_found", "Total arb opps")
     PROM_PROFIT_ETH = PCounter("arb_profit_eth", "Cumulative ETH profit")
     PROM_LATENCY = PHistogram("arb_latency", "Latency for arbs")
+    PROM_SPREAD = PHistogram(
+        "arb_spread",
+        "Spread of detected arbs",
+        buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, float("inf")),
+    )
+    PROM_FAILS = PCounter("arb_fail", "Failed arb attempts")
+    PROM_ALERTS = PCounter("ops_alert", "Ops alerts raised")
     PROM_ERROR_COUNT = PCounter("arb_error_count", "Errors during arb")
     PROM_KILL = PCounter("kill_event_total", "Kill switch events")
     PROM_DRP = PCounter("drp_anomaly_total", "DRP anomalies")
@@ -74,133 +201,356 @@ else:  # pragma: no cover - metrics optional
             pass
 
     PROM_ARB_FOUND = PROM_PROFIT_ETH = PROM_LATENCY = PROM_ERROR_COUNT = PROM_KILL = PROM_DRP = _Dummy()
+    PROM_SPREAD = PROM_FAILS = PROM_ALERTS = _Dummy()
+
+# record_* helpers skip the collector calls entirely without prometheus_client
+_PROM_ENABLED = PCounter is not None
 
 
 # ----------------------------------------------------------------------
 # Metric update helpers
 # ----------------------------------------------------------------------
 
-def record_opportunity(spread: float, pnl: float, latency: float) -> None:
+def reset() -> None:
+    """Reset all custom metrics to their initial values."""
+
+    global _METRICS, _TLS, _SHARDS, _RETIRED, _BODY_CACHE
     with _LOCK:
-        _METRICS["opportunities"] = cast(int, _METRICS["opportunities"]) + 1
-        _METRICS["opportunities_found"] = cast(int, _METRICS.get("opportunities_found", 0)) + 1
-        _METRICS["pnl"] = cast(float, _METRICS["pnl"]) + pnl
-        _METRICS["arb_profit"] = cast(float, _METRICS.get("arb_profit", 0.0)) + pnl
-        cast(list, _METRICS["spreads"]).append(spread)  # type: ignore[arg-type]
-        cast(list, _METRICS["latencies"]).append(latency)  # type: ignore[arg-type]
-        cast(list, _METRICS["arb_latency"]).append(latency)  # type: ignore[arg-type]
-    PROM_ARB_FOUND.inc()
-    PROM_PROFIT_ETH.inc(pnl)
-    PROM_LATENCY.observe(latency)
+        _bump_version()
+        _BODY_CACHE = (-1, 0.0, b"")
+        _METRICS = _Metrics()
+        with _SHARDS_LOCK:
+            _TLS = threading.local()
+            _SHARDS = []
+            _RETIRED = _Shard()
+
+
+def _shard() -> _Shard:
+    tls = _TLS
+    shard: _Shard | None = getattr(tls, "shard", None)
+    if shard is None:
+        shard = tls.shard = _Shard(threading.current_thread())
+        with _SHARDS_LOCK:
+            _SHARDS.append(shard)
+    return shard
+
+
+def _merged_floats() -> Dict[str, float]:
+    """Fold finished threads' shards and sum the float metrics over all."""
+
+    with _SHARDS_LOCK:
+        live = []
+        for shard in _SHARDS:
+            if shard.thread is not None and shard.thread.is_alive():
+                live.append(shard)
+            else:
+                _RETIRED.absorb(shard)
+        _SHARDS[:] = live
+        shards = [_RETIRED, *live]
+    merged = {
+        "pnl": sum(sh.pnl for sh in shards),
+        "arb_profit": sum(sh.arb_profit for sh in shards),
+    }
+    for name in ("spreads", "latencies", "arb_latency"):
+        windows = [getattr(sh, name) for sh in shards]
+        n = sum(len(w.values) for w in windows)
+        merged[name] = sum(w.total for w in windows) / n if n else 0.0
+    return merged
+
+
+def _bump_version() -> None:
+    _VERSION.inc()
 
 
-def record_fail() -> None:
-    with _LOCK:
-        _METRICS["fails"] = cast(int, _METRICS["fails"]) + 1
+def record_opportunity(spread: float, pnl: float, latency: float) -> None:
+    _METRICS.opportunities.inc()
+    _METRICS.opportunities_found.inc()
+    shard = _shard()
+    shard.pnl += pnl
+    shard.arb_profit += pnl
+    shard.spreads.add(spread)
+    shard.latencies.add(latency)
+    shard.arb_latency.add(latency)
+    _bump_version()
+    if _PROM_ENABLED:
+        PROM_ARB_FOUND.inc()
+        PROM_PROFIT_ETH.inc(pnl)
+        PROM_LATENCY.observe(latency)
+        PROM_SPREAD.observe(spread)
 
+
+def record_fail() -> None:
+    _METRICS.fails.inc()
+    if _PROM_ENABLED:
+        PROM_FAILS.inc()
     record_error()
 
 
 def record_error() -> None:
-    with _LOCK:
-        _METRICS["error_count"] = cast(int, _METRICS.get("error_count", 0)) + 1
-    PROM_ERROR_COUNT.inc()
+    _METRICS.error_count.inc()
+    _bump_version()
+    if _PROM_ENABLED:
+        PROM_ERROR_COUNT.inc()
 
 def record_alert() -> None:
-    with _LOCK:
-        _METRICS["alert_count"] = cast(int, _METRICS["alert_count"]) + 1
+    _METRICS.alert_count.inc()
+    _bump_version()
+    if _PROM_ENABLED:
+        PROM_ALERTS.inc()
 
 
 
 def record_strategy_score(sid: str, score: float) -> None:
-    with _LOCK:
-        scores = cast(Dict[str, float], _METRICS.setdefault("strategy_scores", {}))
-        scores[sid] = score
+    # dict stores are atomic under the GIL; scrapes snapshot the values.
+    # The line is formatted here so scrapes only concatenate bytes.
+    m = _METRICS
+    m.strategy_scores[sid] = score
+    m.score_lines[sid] = f'strategy_score{{strategy="{sid}"}} {score}\n'.encode()
+    _bump_version()
+
+
+def record_scoreboard_event(
+    *, strategy_id: str, success_rate: float, total_profit: float, edge_decay: float, status: str
+) -> None:
+    """Publish a scoreboard entry as its decayed ``strategy_score``.
+
+    Profit and status stay in the scoreboard's own export.
+    """
+    record_strategy_score(strategy_id, success_rate * edge_decay)
 
 
 def record_prune() -> None:
-    with _LOCK:
-        _METRICS["prune_total"] = cast(int, _METRICS.get("prune_total", 0)) + 1
+    _METRICS.prune_total.inc()
+    _bump_version()
 
 
 def record_decay_alert() -> None:
-    with _LOCK:
-        _METRICS["decay_alerts"] = cast(int, _METRICS.get("decay_alerts", 0)) + 1
+    _METRICS.decay_alerts.inc()
+    _bump_version()
 
 
 def record_mutation_event() -> None:
-    with _LOCK:
-        _METRICS["mutation_events"] = cast(int, _METRICS.get("mutation_events", 0)) + 1
+    _METRICS.mutation_events.inc()
+    _bump_version()
 
 
 def record_abort() -> None:
     """Record a trade abort decision."""
-    with _LOCK:
-        _METRICS["abort_total"] = cast(int, _METRICS.get("abort_total", 0)) + 1
+    _METRICS.abort_total.inc()
+    _bump_version()
 
 def record_kill_event_metric() -> None:
-    with _LOCK:
-        _METRICS["kill_events"] = cast(int, _METRICS.get("kill_events", 0)) + 1
-    PROM_KILL.inc()
+    _METRICS.kill_events.inc()
+    _bump_version()
+    if _PROM_ENABLED:
+        PROM_KILL.inc()
 
 
 def record_drp_anomaly() -> None:
-    with _LOCK:
-        _METRICS["drp_anomalies"] = cast(int, _METRICS.get("drp_anomalies", 0)) + 1
-    PROM_DRP.inc()
+    _METRICS.drp_anomalies.inc()
+    _bump_version()
+    if _PROM_ENABLED:
+        PROM_DRP.inc()
 
 
 # ----------------------------------------------------------------------
 # Metrics server
 # ----------------------------------------------------------------------
 
-class _Handler(BaseHTTPRequestHandler):
-    """Serve metrics data for Prometheus scraping."""
-    def do_GET(self) -> None:  # pragma: no cover - trivial
-        if _METRICS_TOKEN:
-            auth = self.headers.get("Authorization")
-            if auth != f"Bearer {_METRICS_TOKEN}":
-                self.send_response(401)
-                self.end_headers()
+# one line per _snapshot() key; strategy scores are appended after it
+_TEMPLATE = (
+    "opportunities_total {opportunities}\n"
+    "fails_total {fails}\n"
+    "pnl_total {pnl}\n"
+    "avg_spread {spreads}\n"
+    "avg_latency_seconds {latencies}\n"
+    "alert_count {alert_count}\n"
+    "prune_total {prune_total}\n"
+    "decay_alerts {decay_alerts}\n"
+    "mutation_events {mutation_events}\n"
+    "abort_total {abort_total}\n"
+    "opportunities_found_total {opportunities_found}\n"
+    "arb_profit_total {arb_profit}\n"
+    "avg_arb_latency_seconds {arb_latency}\n"
+    "error_count {error_count}\n"
+    "kill_events_total {kill_events}\n"
+    "drp_anomalies_total {drp_anomalies}\n"
+)
+
+
+def _snapshot() -> Dict[str, object]:
+    """Copy the current metric values; caller holds ``_LOCK``."""
+
+    m = _METRICS
+    snap: Dict[str, object] = {
+        "opportunities": m.opportunities.value,
+        "fails": m.fails.value,
+        "alert_count": m.alert_count.value,
+        "prune_total": m.prune_total.value,
+        "decay_alerts": m.decay_alerts.value,
+        "mutation_events": m.mutation_events.value,
+        "abort_total": m.abort_total.value,
+        "opportunities_found": m.opportunities_found.value,
+        "error_count": m.error_count.value,
+        "kill_events": m.kill_events.value,
+        "drp_anomalies": m.drp_anomalies.value,
+        "score_lines": list(m.score_lines.values()),
+    }
+    snap.update(_merged_floats())
+    return snap
+
+
+def _render_custom() -> bytes:
+    """Return the text exposition of ``_METRICS``.
+
+    ``_LOCK`` is held only to check the cache and take a snapshot; the body
+    is formatted after it is released.
+    """
+
+    global _BODY_CACHE
+    with _LOCK:
+        # read before snapshotting so an update racing the render forces a rebuild
+        version = _VERSION.value
+        cached_version, built_at, body = _BODY_CACHE
+        now = time.monotonic()
+        if version == cached_version or (body and now - built_at < _CACHE_TTL):
+            return body
+        snap = _snapshot()
+    body = _TEMPLATE.format_map(snap).encode() + b"".join(cast(List[bytes], snap["score_lines"]))
+    _BODY_CACHE = (version, now, body)
+    return body
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 501: "Not Implemented"}
+
+
+def _gzipped(body: bytes) -> bytes:
+    global _GZIP_CACHE
+    plain, packed = _GZIP_CACHE
+    if body is not plain:
+        # level 1: scrapers sit on the local network, CPU matters more
+        packed = gzip.compress(body, compresslevel=1)
+        _GZIP_CACHE = (body, packed)
+    return packed
+
+
+def _respond(method: str, path: str, headers: Dict[str, str]) -> tuple[int, bytes, bool]:
+    """Return ``(status, body, gzipped)`` for one request to the metrics endpoint."""
+
+    if method != "GET":
+        return 501, b"", False
+    if _METRICS_TOKEN and headers.get("authorization") != f"Bearer {_METRICS_TOKEN}":
+        return 401, b"", False
+    if path != "/metrics":
+        return 404, b"", False
+    custom = _render_custom()
+    prom = generate_latest() if _PROM_ENABLED else b""
+    # without prometheus_client the cached custom body is served as-is,
+    # which lets _gzipped() recognise it and skip recompression
+    body = prom + custom if prom else custom
+    if "gzip" in headers.get("accept-encoding", ""):
+        return 200, _gzipped(body), True
+    return 200, body, False
+
+
+async def _serve_conn(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer requests on one connection until the client closes it."""
+
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            lines = head.decode("latin-1").split("\r\n")
+            request = lines[0].split()
+            if len(request) != 3:
                 return
-        if self.path != "/metrics":
-            self.send_response(404)
-            self.end_headers()
-            return
-        with _LOCK:
-            spreads = cast(List[float], _METRICS["spreads"])
-            latencies = cast(List[float], _METRICS["latencies"])
-            arb_latencies = cast(List[float], _METRICS.get("arb_latency", []))
-            avg_spread = mean(spreads) if spreads else 0.0
-            avg_latency = mean(latencies) if latencies else 0.0
-            avg_arb_latency = mean(arb_latencies) if arb_latencies else 0.0
-            custom = (
-                f"opportunities_total {_METRICS['opportunities']}\n"
-                f"fails_total {_METRICS['fails']}\n"
-                f"pnl_total {_METRICS['pnl']}\n"
-                f"avg_spread {avg_spread}\n"
-                f"avg_latency_seconds {avg_latency}\n"
-                f"alert_count {_METRICS['alert_count']}\n"
-                f"prune_total {_METRICS['prune_total']}\n"
-                f"decay_alerts {_METRICS['decay_alerts']}\n"
-                f"mutation_events {_METRICS['mutation_events']}\n"
-                f"abort_total {_METRICS['abort_total']}\n"
-                f"opportunities_found_total {_METRICS['opportunities_found']}\n"
-                f"arb_profit_total {_METRICS['arb_profit']}\n"
-                f"avg_arb_latency_seconds {avg_arb_latency}\n"
-                f"error_count {_METRICS['error_count']}\n"
-                f"kill_events_total {_METRICS.get('kill_events', 0)}\n"
-                f"drp_anomalies_total {_METRICS.get('drp_anomalies', 0)}\n"
+            method, path, version = request
+            headers: Dict[str, str] = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # framing is unknown, so answer once and drop the connection
+                status, body, gzipped = 400, b"bad content-length\n", False
+                keep_alive = False
+            else:
+                if length:
+                    await reader.readexactly(length)
+                status, body, gzipped = _respond(method, path, headers)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            encoding = "Content-Encoding: gzip\r\n" if gzipped else ""
+            writer.write(
+                (
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: text/plain\r\n{encoding}"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode()
+                + body
             )
-            body = generate_latest() + custom.encode()
-            scores = cast(Dict[str, float], _METRICS.get("strategy_scores", {}))
-            for sid, val in scores.items():
-                body += f"strategy_score{{strategy=\"{sid}\"}} {val}\n".encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "text/plain")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        return
+    finally:
+        writer.close()
+
+
+class _AsyncServer:
+    """Serve ``/metrics`` from one asyncio loop with HTTP/1.1 keep-alive.
+
+    All scrapes share a single thread instead of a thread per request.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        # METRICS_REUSEPORT=1 lets several workers bind one port; off by
+        # default because each process only knows its own counters
+        reuse_port = os.getenv("METRICS_REUSEPORT") == "1" and hasattr(socket, "SO_REUSEPORT")
+        self.socket = socket.create_server((host, port), reuse_port=reuse_port)
+        self.server_address = self.socket.getsockname()[:2]
+        self.loop = asyncio.new_event_loop()
+        self._stopped = asyncio.Event()
+        # open keep-alive connections, closed on shutdown
+        self._conns: Dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._conns[task] = writer
+        try:
+            await _serve_conn(reader, writer)
+        finally:
+            self._conns.pop(task, None)
+
+    async def _main(self) -> None:
+        server = await asyncio.start_server(self._handle, sock=self.socket)
+        await self._stopped.wait()
+        server.close()
+        # closing the transports ends any pending readuntil() with EOF, so
+        # handlers return normally; cancelling them would log a traceback,
+        # and from 3.12.1 wait_closed() blocks until the clients are gone
+        for writer in list(self._conns.values()):
+            writer.close()
+        await asyncio.gather(*self._conns, return_exceptions=True)
+        await server.wait_closed()
+
+    def serve_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._main())
+        finally:
+            self.loop.close()
+
+    def shutdown(self) -> None:
+        self.loop.call_soon_threadsafe(self._stopped.set)
 
 
 class MetricsServer:
@@ -209,7 +559,7 @@ class MetricsServer:
     def __init__(self, host: str = "0.0.0.0", port: int | None = None) -> None:
         port = int(os.getenv("METRICS_PORT", port or 8000))
         try:
-            self.server = HTTPServer((host, port), _Handler)
+            self.server = _AsyncServer(host, port)
         except OSError as exc:  # pragma: no cover - runtime check
             if "Address already in use" in str(exc):
                 raise OSError(
@@ -228,7 +578,6 @@ class MetricsServer:
 
 if __name__ == "__main__":  # pragma: no cover - manual startup
     import argparse
-    import time
 
     parser = argparse.ArgumentParser(description="Start metrics HTTP server")
     parser.add_argument("--port", type=int, default=None, help="Port to bind")
@@ -2,36 +2,45 @@
 
 from __future__ import annotations
 
-from statistics import mean
-from typing import Dict, List, TypedDict
+from typing import Dict, TypedDict
 
 from core.logger import StructuredLogger
 
 LOG = StructuredLogger("node_selector")
 
+# Weight of the newest latency sample in the per-node moving average.
+_ALPHA = 0.1
+
 
 class NodeSelector:
     """Select the best-performing RPC or relay node."""
 
-    def __init__(self, nodes: Dict[str, str]) -> None:
+    def __init__(self, nodes: Dict[str, str], alpha: float = _ALPHA) -> None:
         self.nodes = nodes
+        self.alpha = alpha
         class _Stats(TypedDict):
-            latencies: List[float]
+            ewma: float
+            samples: int
             success: int
             fail: int
 
         self.stats: Dict[str, _Stats] = {
-            n: {"latencies": [], "success": 0, "fail": 0} for n in nodes
+            n: {"ewma": 0.0, "samples": 0, "success": 0, "fail": 0} for n in nodes
         }
 
     def record(self, node: str, success: bool, latency: float) -> None:
         if node not in self.stats:
             return
-        self.stats[node]["latencies"].append(latency)
+        st = self.stats[node]
+        if st["samples"]:
+            st["ewma"] += self.alpha * (latency - st["ewma"])
+        else:
+            st["ewma"] = latency  # seed with the first sample, not 0
+        st["samples"] += 1
         if success:
-            self.stats[node]["success"] = int(self.stats[node]["success"]) + 1
+            st["success"] += 1
         else:
-            self.stats[node]["fail"] = int(self.stats[node]["fail"]) + 1
+            st["fail"] += 1
         LOG.log(
             "node_perf",
             node=node,
@@ -46,10 +55,9 @@ class NodeSelector:
         best_node = None
         best_score = float("inf")
         for node, st in self.stats.items():
-            latencies = st["latencies"]
-            if not latencies:
+            if not st["samples"]:
                 continue
-            score = mean(latencies) * (1 + st["fail"])  # penalize failures
+            score = st["ewma"] * (1 + st["fail"])  # penalize failures
             if score < best_score:
                 best_score = score
                 best_node = node
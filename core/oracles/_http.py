@@ -0,0 +1,60 @@
+"""Shared keep-alive HTTP session for the oracle feeds.
+
+The intent, NFT and RWA feeds poll the same few hosts every tick; routing
+them through one pooled ``requests.Session`` reuses TCP/TLS connections
+instead of paying a handshake per request.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import requests  # type: ignore
+except Exception:  # pragma: no cover - allow missing dependency
+    requests = None  # type: ignore
+
+try:  # pragma: no cover - optional speedup
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to resp.json()
+    orjson = None  # type: ignore
+
+_SESSION: Any = None
+_SESSION_LOCK = threading.Lock()
+
+
+def session() -> Any:
+    """Return the process-wide pooled session, creating it on first use."""
+
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                sess = requests.Session()
+                try:
+                    from requests.adapters import HTTPAdapter  # type: ignore
+
+                    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+                    sess.mount("https://", adapter)
+                    sess.mount("http://", adapter)
+                except Exception:  # pragma: no cover - optional
+                    pass
+                _SESSION = sess
+    return _SESSION
+
+
+def get(url: str, timeout: float = 5) -> Any:
+    """``GET`` ``url`` over the pooled session."""
+
+    return session().get(url, timeout=timeout)
+
+
+def decode(resp: Any) -> Any:
+    """Parse a JSON response body, using ``orjson`` on the raw bytes when available."""
+
+    if orjson is not None:
+        content = getattr(resp, "content", None)
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            return orjson.loads(content)
+    return resp.json()
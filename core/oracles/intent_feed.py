@@ -9,10 +9,12 @@ service in production.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import itemgetter
 from typing import List
 
 from core.logger import log_error
+from core.oracles import _http
 
 try:  # pragma: no cover - optional dependency
     import requests  # type: ignore
@@ -20,7 +22,7 @@ except Exception:  # pragma: no cover - allow missing dependency
     requests = None  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentData:
     intent_id: str
     domain: str
@@ -28,6 +30,10 @@ class IntentData:
     price: float
 
 
+_INTENT_KEYS = frozenset(f.name for f in fields(IntentData))
+_intent_get = itemgetter(*(f.name for f in fields(IntentData)))
+
+
 class IntentFeed:
     """Fetch intent data from ``INTENT_FEED_URL``."""
 
@@ -39,16 +45,18 @@ class IntentFeed:
             raise RuntimeError("requests package required")
         url = f"{self.base_url}/{domain}/intents"
         try:  # pragma: no cover - network
-            resp = requests.get(url, timeout=5)
+            resp = _http.get(url, timeout=5)
             resp.raise_for_status()
-            data = resp.json()
+            data = _http.decode(resp)
         except Exception as exc:  # pragma: no cover - network
             log_error("IntentFeed", str(exc), event="fetch_intents", domain=domain)
             raise
         intents = []
         for item in data:
             try:
-                intents.append(IntentData(**item))
+                if item.keys() - _INTENT_KEYS:
+                    raise TypeError(f"unexpected fields {sorted(item.keys() - _INTENT_KEYS)}")
+                intents.append(IntentData(*_intent_get(item)))
             except Exception as exc:
                 log_error("IntentFeed", f"bad intent: {exc}", event="parse", domain=domain)
         return intents
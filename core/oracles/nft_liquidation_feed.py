@@ -15,7 +15,8 @@ Simulation/test hooks and kill conditions:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import itemgetter
 from typing import List
 import os
 
@@ -25,9 +26,10 @@ except Exception:  # pragma: no cover - tests may skip
     requests = None  # type: ignore
 
 from core.logger import log_error
+from core.oracles import _http
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuctionData:
     nft: str
     price: float
@@ -36,6 +38,10 @@ class AuctionData:
     end_block: int
 
 
+_AUCTION_KEYS = frozenset(f.name for f in fields(AuctionData))
+_auction_get = itemgetter(*(f.name for f in fields(AuctionData)))
+
+
 class NFTLiquidationFeed:
     """Fetch NFT liquidation auctions."""
 
@@ -47,16 +53,18 @@ class NFTLiquidationFeed:
             raise RuntimeError("requests package required")
         url = f"{self.base_url}/{domain}/auctions"
         try:  # pragma: no cover - network
-            resp = requests.get(url, timeout=5)
+            resp = _http.get(url, timeout=5)
             resp.raise_for_status()
-            data = resp.json()
+            data = _http.decode(resp)
         except Exception as exc:  # pragma: no cover - network errors
             log_error("NFTLiquidationFeed", str(exc), event="fetch_auctions", domain=domain)
             raise
         auctions: List[AuctionData] = []
         for item in data:
             try:
-                auctions.append(AuctionData(**item))
+                if item.keys() - _AUCTION_KEYS:
+                    raise TypeError(f"unexpected fields {sorted(item.keys() - _AUCTION_KEYS)}")
+                auctions.append(AuctionData(*_auction_get(item)))
             except Exception as exc:
                 log_error("NFTLiquidationFeed", f"bad auction: {exc}", event="parse", domain=domain)
         return auctions
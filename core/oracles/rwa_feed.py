@@ -23,9 +23,10 @@ except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
 from core.logger import log_error
+from core.oracles import _http
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RWAData:
     price: float
     fee: float
@@ -43,9 +44,9 @@ class RWAFeed:
             raise RuntimeError("requests package required")
         url = f"{self.base_url}/{venue}/{asset}"
         try:  # pragma: no cover - network
-            resp = requests.get(url, timeout=5)
+            resp = _http.get(url, timeout=5)
             resp.raise_for_status()
-            data = resp.json()
+            data = _http.decode(resp)
         except Exception as exc:  # pragma: no cover
             log_error("RWAFeed", str(exc), event="fetch", asset=asset, venue=venue)
             raise
@@ -7,6 +7,7 @@ Module purpose and system role:
 Integration points and dependencies:
     - Uses `web3` for RPC calls.
     - Relies on minimal UniswapV3Pool ABI to read `slot0` and token decimals.
+    - Batches the pool and block reads through Multicall3 where deployed.
 
 Simulation/test hooks and kill conditions:
     - Designed to operate against forked RPC nodes.
@@ -19,7 +20,7 @@ import os
 from dataclasses import dataclass
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from core.logger import log_error
 
@@ -72,8 +73,63 @@ UNISWAP_V3_POOL_ABI = [
     },
 ]
 
+# sqrtPriceX96 is a Q64.96 fixed-point value, so price = sqrtPriceX96**2 / 2**192
+_Q192 = 1 << 192
 
-@dataclass
+# Multicall3 has the same address on Ethereum, Arbitrum, Optimism and most
+# other EVM chains (https://github.com/mds1/multicall)
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# 4-byte selectors of the argument-free calls batched through aggregate3
+_SLOT0 = bytes.fromhex("3850c7bd")  # slot0()
+_TOKEN0 = bytes.fromhex("0dfe1681")  # token0()
+_TOKEN1 = bytes.fromhex("d21220a7")  # token1()
+_BLOCK_NUMBER = bytes.fromhex("42cbb15c")  # getBlockNumber()
+_BLOCK_TIMESTAMP = bytes.fromhex("0f28c97d")  # getCurrentBlockTimestamp()
+
+
+def _word(data: bytes, index: int = 0) -> int:
+    """Return the ``index``-th 32-byte ABI word of ``data`` as an unsigned int."""
+    return int.from_bytes(data[32 * index : 32 * index + 32], "big")
+
+
+ERC20_DECIMALS_ABI = [
+    {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}
+]
+
+
+@dataclass(slots=True, frozen=True)
 class PriceData:
     """Structured price information for audit and mutation."""
 
@@ -96,6 +152,15 @@ class UniswapV3Feed:
             }
         self.rpc_urls = rpc_urls
         self.web3s: Dict[str, Web3] = {}
+        # pool tokens and ERC-20 decimals are immutable: fetched once per key.
+        # Per pool we keep the integer (numerator, denominator) that turns
+        # sqrtPriceX96**2 into a decimals-adjusted price.
+        self._pool_scale: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._decimals: Dict[Tuple[str, str], int] = {}
+        # building a Contract parses the ABI; keep one per pool
+        self._pool_contracts: Dict[Tuple[str, str], Contract] = {}
+        # Multicall3 contract per domain, None where it is not deployed
+        self._multicalls: Dict[str, Contract | None] = {}
         if Web3 is not None:  # pragma: no cover - environment dependent
             for domain, url in rpc_urls.items():
                 self.web3s[domain] = Web3(Web3.HTTPProvider(url))
@@ -108,28 +173,81 @@ class UniswapV3Feed:
         return self.web3s[domain]
 
     def _get_token_decimals(self, w3: Web3, token_address: str) -> int:
-        erc20_abi = [{"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}]
-        token = w3.eth.contract(address=token_address, abi=erc20_abi)
+        token = w3.eth.contract(address=token_address, abi=ERC20_DECIMALS_ABI)
         return int(token.functions.decimals().call())
 
+    def _decimals_cached(self, w3: Web3, domain: str, token_address: str) -> int:
+        key = (domain, token_address)
+        dec = self._decimals.get(key)
+        if dec is None:
+            dec = self._decimals[key] = self._get_token_decimals(w3, token_address)
+        return dec
+
+    def _multicall(self, w3: Web3, domain: str) -> Contract | None:
+        if domain not in self._multicalls:
+            mc = None
+            if w3.eth.get_code(MULTICALL3_ADDRESS):
+                mc = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+            self._multicalls[domain] = mc
+        return self._multicalls[domain]
+
+    def _read_pool(
+        self, w3: Web3, domain: str, pool: str, with_tokens: bool
+    ) -> Tuple[int, int, int, Tuple[str, str] | None]:
+        """Return ``(sqrtPriceX96, block number, block timestamp, tokens)``.
+
+        Where Multicall3 is deployed this is one ``eth_call``: slot0, the
+        block number and timestamp, plus token0/token1 when ``with_tokens``.
+        Otherwise the pool and the latest block are read separately.
+        """
+        mc = self._multicall(w3, domain)
+        if mc is None:
+            contract = self._pool_contracts.get((domain, pool))
+            if contract is None:
+                contract = w3.eth.contract(address=pool, abi=UNISWAP_V3_POOL_ABI)
+                self._pool_contracts[(domain, pool)] = contract
+            slot0 = contract.functions.slot0().call()
+            block = w3.eth.get_block("latest")
+            tokens = None
+            if with_tokens:
+                tokens = (contract.functions.token0().call(), contract.functions.token1().call())
+            return slot0[0], block.number, block.timestamp, tokens
+        calls = [
+            (pool, False, _SLOT0),
+            (MULTICALL3_ADDRESS, False, _BLOCK_NUMBER),
+            (MULTICALL3_ADDRESS, False, _BLOCK_TIMESTAMP),
+        ]
+        if with_tokens:
+            calls += [(pool, False, _TOKEN0), (pool, False, _TOKEN1)]
+        results = [data for _ok, data in mc.functions.aggregate3(calls).call()]
+        tokens = None
+        if with_tokens:
+            # address return values sit in the low 20 bytes of the word
+            tokens = (
+                w3.to_checksum_address(results[3][12:32]),
+                w3.to_checksum_address(results[4][12:32]),
+            )
+        return _word(results[0]), _word(results[1]), _word(results[2]), tokens
+
     def fetch_price(self, pool: str, domain: str) -> PriceData:
         """Return price for ``pool`` on ``domain``."""
         w3 = self._get_web3(domain)
         try:
-            contract: Contract = w3.eth.contract(address=pool, abi=UNISWAP_V3_POOL_ABI)
-            slot0 = contract.functions.slot0().call()
-            sqrt_price_x96 = slot0[0]
-            token0 = contract.functions.token0().call()
-            token1 = contract.functions.token1().call()
-            dec0 = self._get_token_decimals(w3, token0)
-            dec1 = self._get_token_decimals(w3, token1)
-            price = (sqrt_price_x96 ** 2) / (2 ** 192)
-            price *= 10 ** (dec0 - dec1)
-            block = w3.eth.get_block("latest")
+            scale = self._pool_scale.get((domain, pool))
+            sqrt_price_x96, block_number, block_ts, tokens = self._read_pool(w3, domain, pool, scale is None)
+            if scale is None:
+                assert tokens is not None
+                token0, token1 = tokens
+                shift = self._decimals_cached(w3, domain, token0) - self._decimals_cached(w3, domain, token1)
+                scale = (10 ** shift, _Q192) if shift >= 0 else (1, _Q192 * 10 ** -shift)
+                self._pool_scale[(domain, pool)] = scale
+            num, den = scale
+            # exact big-int product, one correctly rounded division
+            price = sqrt_price_x96 * sqrt_price_x96 * num / den
         except Exception as exc:
             log_error("UniswapV3Feed", str(exc), event="fetch_price", pool=pool, domain=domain)
             raise
-        block_age = int(time.time()) - block.timestamp
+        block_age = int(time.time()) - block_ts
         if block_age > PRICE_FRESHNESS_SEC:
             logging.warning("stale price data: %s sec old on %s", block_age, domain)
             log_error(
@@ -140,4 +258,4 @@ class UniswapV3Feed:
                 domain=domain,
                 block_age=block_age,
             )
-        return PriceData(price=float(price), pool=pool, block=block.number, timestamp=block.timestamp, block_age=block_age)
+        return PriceData(price=float(price), pool=pool, block=block_number, timestamp=block_ts, block_age=block_age)
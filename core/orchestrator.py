@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import importlib
 import os
+import re
 import subprocess
+import threading
 import time
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, cast
 
 from core.logger import StructuredLogger, log_error
 from core.tx_engine.kill_switch import kill_switch_triggered, record_kill_event
@@ -26,16 +33,19 @@ from orchestrator_ttl import StrategyTTLManager
 LOGGER = StructuredLogger("orchestrator")
 
 
+# one ``key: value`` (or bare ``key``) line; blank and comment lines never match
+_YAML_LINE = re.compile(r"^([ \t]*)([^\s#][^:\n]*)(?::[ \t]*(.*?))?[ \t\r]*$", re.MULTILINE)
+_YAML_BOOLS = {"true": True, "false": False}
+
+
 def _simple_yaml_load(text: str) -> Dict[str, Any]:
     """Very small YAML subset parser used if PyYAML is unavailable."""
     data: Dict[str, Any] = {}
     stack: List[tuple[int, Dict[str, Any]]] = [(0, data)]
-    for raw in text.splitlines():
-        if not raw.strip() or raw.lstrip().startswith("#"):
-            continue
-        indent = len(raw) - len(raw.lstrip())
-        key, _, value = raw.lstrip().partition(":")
-        value = value.strip()
+    for match in _YAML_LINE.finditer(text):
+        lead, key, value = match.group(1, 2, 3)
+        value = value or ""
+        indent = len(lead)
         while stack and indent < stack[-1][0]:
             stack.pop()
         parent = stack[-1][1]
@@ -49,8 +59,8 @@ def _simple_yaml_load(text: str) -> Dict[str, Any]:
         elif value.startswith("[") and value.endswith("]"):
             items = [v.strip().strip('"\'') for v in value[1:-1].split(",") if v.strip()]
             parent[key] = items
-        elif value.lower() in {"true", "false"}:
-            parent[key] = value.lower() == "true"
+        elif (flag := _YAML_BOOLS.get(value.lower())) is not None:
+            parent[key] = flag
         else:
             try:
                 parent[key] = int(value)
@@ -62,16 +72,55 @@ def _simple_yaml_load(text: str) -> Dict[str, Any]:
     return data
 
 
+# parsed configs keyed by absolute path; an entry is reused only while the
+# file's (mtime_ns, size) is unchanged
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+
+
 def load_config(path: str) -> Dict[str, Any]:
-    """Load YAML config from ``path`` using PyYAML if available."""
+    """Load YAML config from ``path`` using PyYAML if available.
+
+    Returns a fresh copy on every call so callers may mutate the result.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    hit = _CONFIG_CACHE.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(hit[2])
     try:
         import yaml  # type: ignore[import-untyped]
     except Exception:  # pragma: no cover - optional
         yaml = cast(Any, None)
-    text = Path(path).read_text()
+    text = Path(key).read_text()
     if yaml is not None:
-        return cast(Dict[str, Any], yaml.safe_load(text))
-    return _simple_yaml_load(text)
+        # libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = cast(Dict[str, Any], yaml.load(text, Loader=loader))
+    else:
+        data = _simple_yaml_load(text)
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _CONFIG_CACHE.move_to_end(key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _strategy_cls(module: ModuleType) -> Any:
+    """Return the strategy class exported by ``module``.
+
+    Keyed on the module object, so a reloaded module is scanned afresh.
+    Prefers a class defined in the module that has ``run_once`` over
+    uppercase names it merely imports (``Any``, ``Path``...).
+    """
+    names = [n for n in vars(module) if n[0].isupper()]
+    for name in names:
+        obj = getattr(module, name)
+        if isinstance(obj, type) and obj.__module__ == module.__name__ and hasattr(obj, "run_once"):
+            return obj
+    return getattr(module, names[0])
 
 
 class StrategyOrchestrator:
@@ -87,8 +136,10 @@ class StrategyOrchestrator:
             float(risk.get("max_loss_usd", 0)),
             capital,
         )
+        # kill switch state for the tick in progress; None outside run_once
+        self._tick_kill: bool | None = None
         checks = {
-            "kill_switch": lambda: not kill_switch_triggered(),
+            "kill_switch": lambda: not self._kill_switch(),
             "capital_lock": self.capital_lock.trade_allowed,
         }
         self.ops_agent = OpsAgent(checks)
@@ -108,11 +159,21 @@ class StrategyOrchestrator:
         self.strategies: Dict[str, Any] = {}
         self._load_strategies()
 
+        # a full DRP export forks bash, tars logs and queries Grafana and
+        # Prometheus; operators may set DRP_EXPORT_INTERVAL to skip it on ticks
+        # within that many seconds of a success. Off by default: every cycle
+        # exports (AGENTS.md)
+        self.export_interval = float(os.getenv("DRP_EXPORT_INTERVAL", "0"))
+        self._last_export: float | None = None
+        self._wake = threading.Event()
+        # worker threads for ticks with several strategies; created on first use
+        self._pool: ThreadPoolExecutor | None = None
+
     def _load_strategies(self) -> None:
         for sid in self.strategy_ids:
             try:
                 module = importlib.import_module(f"strategies.{sid}.strategy")
-                cls = getattr(module, [n for n in dir(module) if n[0].isupper()][0])
+                cls = _strategy_cls(module)
                 params = self.strategy_params.get(sid, {}).copy()
                 params["nonce_manager"] = self.nonce_manager
                 strat = cls(**params)
@@ -124,12 +185,19 @@ class StrategyOrchestrator:
             except Exception as exc:
                 log_error("orchestrator", str(exc), strategy_id=sid, event="load_fail")
 
-    def _snapshot_state(self) -> bool:
+    def _snapshot_state(self, *, force: bool = False) -> bool | None:
+        """Run ``export_state.sh``; return None if skipped by ``export_interval``."""
+        now = time.monotonic()
+        if not force and self._last_export is not None and now - self._last_export < self.export_interval:
+            return None
+        # export_state.sh copies the nonce cache file, which is written lazily
+        self.nonce_manager.flush()
         cmd = ["bash", "scripts/export_state.sh"]
         if self.dry_run:
             cmd.append("--dry-run")
         try:
             subprocess.run(cmd, check=True, capture_output=True, text=True)
+            self._last_export = now
             return True
         except FileNotFoundError:
             log_error("orchestrator", "export_state.sh missing", event="snapshot_fail")
@@ -137,10 +205,25 @@ class StrategyOrchestrator:
             log_error("orchestrator", f"snapshot fail: {exc.stderr}", event="snapshot_fail")
         return False
 
-    def run_once(self) -> bool:
+    def _kill_switch(self) -> bool:
+        if self._tick_kill is not None:
+            return self._tick_kill
+        return kill_switch_triggered()
+
+    def run_once(self, killed: bool | None = None) -> bool:
+        # check the kill switch (env + flag file stat) once per tick and share
+        # the answer with the health checks and the gatekeeper; the live loop
+        # passes in the result of its own check
+        self._tick_kill = kill_switch_triggered() if killed is None else killed
+        try:
+            return self._run_tick(self._tick_kill)
+        finally:
+            self._tick_kill = None
+
+    def _run_tick(self, killed: bool) -> bool:
         self.ops_agent.run_checks()
-        if not gates_green(self.capital_lock, self.ops_agent, self.drp_agent):
-            if kill_switch_triggered():
+        if not gates_green(self.capital_lock, self.ops_agent, self.drp_agent, kill_switch=killed):
+            if killed:
                 record_kill_event("orchestrator")
             return False
 
@@ -157,33 +240,65 @@ class StrategyOrchestrator:
         ]
         self.strategies = {sid: s for sid, s in self.strategies.items() if sid in active_sids}
 
-        for sid, strat in self.strategies.items():
-            try:
-                strat.run_once()
-            except Exception as exc:  # pragma: no cover - runtime
-                log_error("orchestrator", str(exc), strategy_id=sid, event="exec_fail")
-                self.ops_agent.auto_pause("strategy_fail")
-                return False
+        if not self._run_strategies():
+            self.ops_agent.auto_pause("strategy_fail")
+            return False
 
         ok = self._snapshot_state()
-        self.drp_agent.record_export(ok)
+        if ok is not None:  # a skipped export is neither a success nor a failure
+            self.drp_agent.record_export(ok)
         self.drp_agent.auto_recover()
         LOGGER.log("iteration_complete", risk_level="low")
         return True
 
+    def _run_strategies(self) -> bool:
+        """Run every strategy once; return False if any of them raised.
+
+        Strategies mostly wait on RPC and websocket I/O, so with more than one
+        they run on a thread pool and the tick takes as long as the slowest
+        strategy rather than the sum of all of them.
+        """
+        if len(self.strategies) <= 1:
+            for sid, strat in self.strategies.items():
+                try:
+                    strat.run_once()
+                except Exception as exc:  # pragma: no cover - runtime
+                    log_error("orchestrator", str(exc), strategy_id=sid, event="exec_fail")
+                    return False
+            return True
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=min(32, len(self.strategies)), thread_name_prefix="strat")
+        futures = {sid: self._pool.submit(strat.run_once) for sid, strat in self.strategies.items()}
+        ok = True
+        for sid, fut in futures.items():
+            err = fut.exception()
+            if err is not None:
+                log_error("orchestrator", str(err), strategy_id=sid, event="exec_fail")
+                ok = False
+        return ok
+
+    def wake(self) -> None:
+        """Cut the current wait in :meth:`run_live_loop` short.
+
+        Safe to call from any thread, e.g. a kill-switch or signal handler.
+        """
+        self._wake.set()
+
     def run_live_loop(self, interval: int = 5) -> None:
         while True:
-            if kill_switch_triggered():
+            killed = kill_switch_triggered()
+            if killed:
                 record_kill_event("orchestrator_loop")
-                self._snapshot_state()
+                self._snapshot_state(force=True)
                 break
-            cont = self.run_once()
+            cont = self.run_once(killed)
             if not cont:
                 LOGGER.log("halt", risk_level="high")
                 break
             if self.dry_run:
                 break
-            time.sleep(interval)
+            self._wake.wait(timeout=interval)
+            self._wake.clear()
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Strategy orchestrator")
@@ -193,7 +308,8 @@ def main() -> None:
     parser.add_argument("--health", action="store_true", help="Only run health checks")
     args = parser.parse_args()
 
-    dry = args.dry_run or os.getenv("DRY_RUN") == "1" or (not args.live and load_config(args.config).get("mode") != "live")
+    config = load_config(args.config)
+    dry = args.dry_run or os.getenv("DRY_RUN") == "1" or (not args.live and config.get("mode") != "live")
     orchestrator = StrategyOrchestrator(args.config, dry_run=dry)
     if args.health:
         orchestrator.ops_agent.run_checks()
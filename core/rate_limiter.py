@@ -9,6 +9,8 @@ import time
 class RateLimiter:
     """Limit how often actions can be performed."""
 
+    __slots__ = ("rate", "_allow_at", "_lock")
+
     def __init__(self, rate: float) -> None:
         if rate <= 0:
             raise ValueError("rate must be > 0")
@@ -17,9 +19,14 @@ class RateLimiter:
         self._lock = threading.Lock()
 
     def wait(self) -> None:
-        """Block until the next action is allowed."""
+        """Block until the next action is allowed.
+
+        Each caller reserves its slot under the lock and sleeps after
+        releasing it, so waiters do not queue behind each other's sleeps.
+        """
         with self._lock:
             now = time.monotonic()
-            if now < self._allow_at:
-                time.sleep(self._allow_at - now)
-            self._allow_at = max(now, self._allow_at) + 1 / self.rate
+            slot = max(now, self._allow_at)
+            self._allow_at = slot + 1 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
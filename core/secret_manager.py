@@ -2,6 +2,15 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Dict, Tuple
+
+# name -> (path, mtime_ns, size, value); revalidated with a single stat
+_CACHE: Dict[str, Tuple[str, int, int, str]] = {}
+
+
+def clear_secret_cache() -> None:
+    """Drop cached file-backed secrets, e.g. after a rotation."""
+    _CACHE.clear()
 
 
 def get_secret(name: str) -> str:
@@ -11,13 +20,24 @@ def get_secret(name: str) -> str:
     secret. If found, the file's contents are returned. Otherwise the
     environment variable ``name`` is used. Raises ``RuntimeError`` if the
     secret is not found.
+
+    File contents are cached per process and re-read only when the file's
+    path, mtime or size changes.
     """
     file_var = f"{name}_FILE"
     path = os.getenv(file_var)
     if path:
-        p = Path(path)
-        if p.exists():
-            return p.read_text().strip()
+        try:
+            st = os.stat(path)
+        except OSError:
+            _CACHE.pop(name, None)
+        else:
+            cached = _CACHE.get(name)
+            if cached and cached[:3] == (path, st.st_mtime_ns, st.st_size):
+                return cached[3]
+            value = Path(path).read_text().strip()
+            _CACHE[name] = (path, st.st_mtime_ns, st.st_size, value)
+            return value
     val = os.getenv(name)
     if val:
         return val
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-import json
 import os
+from collections import deque
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Deque, Dict, Optional
 
-from core.logger import StructuredLogger, log_error
+from core.logger import StructuredLogger, append_json_line, log_error
 from core import metrics
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceTracker:
-    """Track strategy profitability and failures."""
+    """Track strategy profitability and failures.
 
-    pnl_history: List[float] = field(default_factory=list)
+    ``pnl_history`` keeps only the most recent ``PNL_HISTORY_MAX`` results
+    (default 10000) so long-running strategies do not grow without bound.
+    """
+
+    pnl_history: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=int(os.getenv("PNL_HISTORY_MAX", "10000")))
+    )
     fail_count: int = 0
 
     def record(self, success: bool, pnl: float) -> None:
@@ -45,6 +50,8 @@ class BaseStrategy:
     # ------------------------------------------------------------------
     def validate_costs(self, expected_profit: float) -> bool:
         """Return True if expected profit exceeds all estimated costs."""
+        # read per check, like the strategies' own gas/slippage lookups, so
+        # runtime changes apply to every cost estimate in the same tick
         gas = float(os.getenv("GAS_COST_OVERRIDE", "0"))
         slippage = float(os.getenv("SLIPPAGE_PCT", "0")) * expected_profit
         cex_fee = float(os.getenv("CEX_FEE_PCT", "0")) * expected_profit
@@ -76,14 +83,11 @@ class BaseStrategy:
             return
         if self.performance.fail_count >= self.prune_epochs:
             self.disabled = True
-            Path("logs").mkdir(exist_ok=True)
-            path = Path("logs/prune.log")
             entry = {
                 "strategy": self.strategy_id,
                 "reason": "fail_threshold",
                 "fail_count": self.performance.fail_count,
             }
-            with path.open("a") as fh:
-                fh.write(json.dumps(entry) + "\n")
+            append_json_line("logs/prune.log", entry)
             metrics.record_prune()
             self.logger.log("auto_prune", strategy_id=self.strategy_id, risk_level="high")
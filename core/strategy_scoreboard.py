@@ -3,26 +3,40 @@ Strategy Scoreboard with Auto-Pruning and Edge Decay.
 Benchmarks strategies against real-time signals and manages lifecycle.
 """
 
+from __future__ import annotations
+
 import asyncio
+import heapq
 import json
 import os
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from enum import Enum
-import numpy as np
-from collections import defaultdict
-import aiohttp
+from collections import deque
+
+try:  # pragma: no cover - optional dependency
+    import aiohttp  # type: ignore
+except Exception:  # pragma: no cover - HTTP signal collectors disabled
+    aiohttp = None  # type: ignore
+
+try:  # pragma: no cover - optional speedup
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to json
+    orjson = None  # type: ignore
 
-from core.logger import StructuredLogger
+from core.logger import StructuredLogger, append_json_line
 from core.metrics import record_scoreboard_event
 from ai.voting import VotingQuorum
 
 LOG = StructuredLogger("strategy_scoreboard", log_file="logs/scoreboard.json")
 SCOREBOARD_STATE_FILE = Path("state/strategy_scoreboard.json")
 MUTATION_LOG_FILE = Path("logs/mutation_log.json")
+# per-source signal totals are reused for calls within the same bucket of
+# this many seconds, as long as no signal was appended in between
+SIGNAL_TOTALS_TTL = 30
 
 
 class StrategyStatus(Enum):
@@ -32,6 +46,9 @@ class StrategyStatus(Enum):
     ARCHIVED = "archived"
 
 
+_LEADERBOARD_STATUSES = frozenset((StrategyStatus.ACTIVE, StrategyStatus.PROBATION))
+
+
 class SignalSource(Enum):
     DEX_CEX_GAP = "dex_cex_gap"
     WHALE_ALERT = "whale_alert"
@@ -53,8 +70,39 @@ class StrategyScore:
     last_opportunity: Optional[str]
     last_update: str
     status: StrategyStatus
-    performance_trend: List[float]  # Last 7 days
+    performance_trend: Deque[float]  # Last 7 days
     signal_scores: Dict[str, float]  # Score by signal source
+    error_count: int = 0  # error_rate is error_count / total_opportunities
+    # success_rate * edge_decay_factor, refreshed by _apply_edge_decay; not persisted
+    effective_score: float = field(default=0.0, compare=False)
+    
+    def __post_init__(self):
+        # loaded state carries a plain list; appends past 7 evict the oldest
+        self.performance_trend = deque(self.performance_trend, maxlen=7)
+        self.effective_score = self.success_rate * self.edge_decay_factor
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the persisted form: field references, ``status`` as its value.
+
+        Unlike ``dataclasses.asdict`` nothing is deep-copied; the result is
+        only serialised, never mutated.
+        """
+        return {
+            "strategy_id": self.strategy_id,
+            "total_opportunities": self.total_opportunities,
+            "captured_opportunities": self.captured_opportunities,
+            "total_profit_eth": self.total_profit_eth,
+            "avg_latency_ms": self.avg_latency_ms,
+            "error_rate": self.error_rate,
+            "success_rate": self.success_rate,
+            "edge_decay_factor": self.edge_decay_factor,
+            "last_opportunity": self.last_opportunity,
+            "last_update": self.last_update,
+            "status": self.status.value,
+            "performance_trend": list(self.performance_trend),
+            "signal_scores": self.signal_scores,
+            "error_count": self.error_count,
+        }
 
 
 @dataclass
@@ -84,11 +132,22 @@ class StrategyScoreboard:
         
         self.prune_threshold = prune_threshold
         self.decay_rate = decay_rate
+        # decay_rate ** days for the first year, looked up instead of pow()
+        self._decay_lut = tuple(decay_rate ** d for d in range(366))
         self.probation_threshold = probation_threshold
         
         self.scores: Dict[str, StrategyScore] = {}
-        self.market_signals: List[MarketSignal] = []
+        # newest 1000 signals; appends evict the oldest in O(1)
+        self.market_signals: Deque[MarketSignal] = deque(maxlen=1000)
         self.voting_quorum = VotingQuorum()
+        # one HTTP session shared by all collectors, created on first use so
+        # the connection pool, DNS cache and TLS sessions survive between polls
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._tasks: List[asyncio.Task] = []
+        self._totals_cache: Optional[Tuple[Tuple[Any, ...], Dict[SignalSource, float]]] = None
+        # score updates only mark the state dirty; _flush_loop writes it out
+        self._dirty = False
+        self.flush_interval = float(os.getenv("SCOREBOARD_FLUSH_INTERVAL", "5"))
         
         self._load_state()
         self._start_signal_collection()
@@ -96,33 +155,86 @@ class StrategyScoreboard:
     def _load_state(self):
         """Load scoreboard state from disk."""
         if SCOREBOARD_STATE_FILE.exists():
-            with open(SCOREBOARD_STATE_FILE) as f:
-                data = json.load(f)
-                for sid, score_data in data.get("scores", {}).items():
-                    score_data["status"] = StrategyStatus(score_data["status"])
-                    self.scores[sid] = StrategyScore(**score_data)
+            raw = SCOREBOARD_STATE_FILE.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            for sid, score_data in data.get("scores", {}).items():
+                score_data["status"] = StrategyStatus(score_data["status"])
+                if "error_count" not in score_data:  # state saved before error_count existed
+                    score_data["error_count"] = round(
+                        score_data["error_rate"] * score_data["total_opportunities"]
+                    )
+                self.scores[sid] = StrategyScore(**score_data)
     
     def _save_state(self):
         """Save scoreboard state to disk."""
-        SCOREBOARD_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
         data = {
             "scores": {
-                sid: {**asdict(score), "status": score.status.value}
+                sid: score.to_dict()
                 for sid, score in self.scores.items()
             },
             "last_update": datetime.now(timezone.utc).isoformat()
         }
         
-        with open(SCOREBOARD_STATE_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+        # write a sibling file and rename over the old state so a crash
+        # mid-write never leaves a truncated scoreboard behind
+        tmp = SCOREBOARD_STATE_FILE.with_name(SCOREBOARD_STATE_FILE.name + ".tmp")
+        try:
+            f = open(tmp, "wb")
+        except FileNotFoundError:
+            # first save only; afterwards the directory exists
+            SCOREBOARD_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp, "wb")
+        with f:
+            f.write(payload)
+        os.replace(tmp, SCOREBOARD_STATE_FILE)
+        self._dirty = False
     
     def _start_signal_collection(self):
         """Start background tasks for signal collection."""
-        asyncio.create_task(self._collect_dex_cex_gaps())
-        asyncio.create_task(self._collect_whale_alerts())
-        asyncio.create_task(self._collect_dune_signals())
-        asyncio.create_task(self._collect_coinbase_flow())
+        self._tasks = [
+            asyncio.create_task(self._collect_dex_cex_gaps()),
+            asyncio.create_task(self._collect_whale_alerts()),
+            asyncio.create_task(self._collect_dune_signals()),
+            asyncio.create_task(self._collect_coinbase_flow()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+    
+    async def _flush_loop(self):
+        """Write dirty state at most once per ``flush_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                LOG.log("state_flush_error", error=str(e))
+    
+    def flush(self):
+        """Write the state file now if any score changed since the last save."""
+        if self._dirty:
+            self._save_state()
+    
+    def _session(self) -> aiohttp.ClientSession:
+        """Return the shared collector session, creating it if needed."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._http
+    
+    async def close(self):
+        """Stop signal collection and close the shared HTTP session."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self.flush()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
     
     async def _collect_dex_cex_gaps(self):
         """Monitor DEX/CEX price gaps."""
@@ -147,10 +259,6 @@ class StrategyScoreboard:
                 
                 self.market_signals.append(signal)
                 
-                # Keep only last 1000 signals
-                if len(self.market_signals) > 1000:
-                    self.market_signals = self.market_signals[-1000:]
-                
             except Exception as e:
                 LOG.log("signal_collection_error", source="dex_cex", error=str(e))
             
@@ -158,40 +266,41 @@ class StrategyScoreboard:
     
     async def _collect_whale_alerts(self):
         """Monitor whale movements."""
-        if not self.whale_alert_key:
+        if not self.whale_alert_key or aiohttp is None:
             return
         
         while True:
             try:
-                async with aiohttp.ClientSession() as session:
-                    url = "https://api.whale-alert.io/v1/transactions"
-                    params = {
-                        "api_key": self.whale_alert_key,
-                        "min_value": "1000000",  # $1M+ transactions
-                        "limit": 100
-                    }
-                    
-                    async with session.get(url, params=params, timeout=10) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            
-                            for tx in data.get("transactions", []):
-                                if tx.get("blockchain") == "ethereum":
-                                    signal = MarketSignal(
-                                        source=SignalSource.WHALE_ALERT,
-                                        timestamp=datetime.fromisoformat(tx["timestamp"]),
-                                        opportunity_value_eth=float(tx.get("amount_usd", 0)) / 2000,  # Rough ETH conversion
-                                        confidence=0.7,
-                                        metadata={
-                                            "from": tx.get("from", {}).get("address"),
-                                            "to": tx.get("to", {}).get("address"),
-                                            "symbol": tx.get("symbol"),
-                                            "amount": tx.get("amount")
-                                        }
-                                    )
-                                    
-                                    self.market_signals.append(signal)
+                session = self._session()
+                url = "https://api.whale-alert.io/v1/transactions"
+                params = {
+                    "api_key": self.whale_alert_key,
+                    "min_value": "1000000",  # $1M+ transactions
+                    "limit": 100
+                }
                 
+                async with session.get(url, params=params, timeout=10) as resp:
+                    if resp.status == 200:
+                        raw = await resp.read()
+                        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                        
+                        self.market_signals.extend(
+                            MarketSignal(
+                                source=SignalSource.WHALE_ALERT,
+                                timestamp=datetime.fromisoformat(tx["timestamp"]),
+                                opportunity_value_eth=float(tx.get("amount_usd", 0)) / 2000,  # Rough ETH conversion
+                                confidence=0.7,
+                                metadata={
+                                    "from": tx.get("from", {}).get("address"),
+                                    "to": tx.get("to", {}).get("address"),
+                                    "symbol": tx.get("symbol"),
+                                    "amount": tx.get("amount")
+                                }
+                            )
+                            for tx in data.get("transactions", ())
+                            if tx.get("blockchain") == "ethereum"
+                        )
+            
             except Exception as e:
                 LOG.log("signal_collection_error", source="whale_alert", error=str(e))
             
@@ -199,7 +308,7 @@ class StrategyScoreboard:
     
     async def _collect_dune_signals(self):
         """Collect signals from Dune Analytics."""
-        if not self.dune_api_key:
+        if not self.dune_api_key or aiohttp is None:
             return
         
         # Example Dune queries for MEV opportunities
@@ -209,33 +318,45 @@ class StrategyScoreboard:
             {"id": "3456789", "name": "liquidation_targets"}
         ]
         
+        headers = {"X-Dune-API-Key": self.dune_api_key}
+        
+        async def fetch(session: aiohttp.ClientSession, query: Dict[str, str]) -> Optional[Dict[str, Any]]:
+            url = f"https://api.dune.com/api/v1/query/{query['id']}/results"
+            async with session.get(url, headers=headers, timeout=30) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+            return None
+        
         while True:
             try:
-                async with aiohttp.ClientSession() as session:
-                    headers = {"X-Dune-API-Key": self.dune_api_key}
+                session = self._session()
+                # The queries are independent; overlap their round trips
+                results = await asyncio.gather(
+                    *(fetch(session, query) for query in queries), return_exceptions=True
+                )
+                
+                for query, data in zip(queries, results):
+                    if isinstance(data, BaseException):
+                        LOG.log("signal_collection_error", source="dune", query=query["name"], error=str(data))
+                        continue
+                    if not data:
+                        continue
                     
-                    for query in queries:
-                        url = f"https://api.dune.com/api/v1/query/{query['id']}/results"
+                    # Process query results
+                    for row in data.get("result", {}).get("rows", []):
+                        signal = MarketSignal(
+                            source=SignalSource.DUNE_QUERY,
+                            timestamp=datetime.now(timezone.utc),
+                            opportunity_value_eth=float(row.get("opportunity_eth", 0)),
+                            confidence=0.85,
+                            metadata={
+                                "query": query["name"],
+                                "data": row
+                            }
+                        )
                         
-                        async with session.get(url, headers=headers, timeout=30) as resp:
-                            if resp.status == 200:
-                                data = await resp.json()
-                                
-                                # Process query results
-                                for row in data.get("result", {}).get("rows", []):
-                                    signal = MarketSignal(
-                                        source=SignalSource.DUNE_QUERY,
-                                        timestamp=datetime.now(timezone.utc),
-                                        opportunity_value_eth=float(row.get("opportunity_eth", 0)),
-                                        confidence=0.85,
-                                        metadata={
-                                            "query": query["name"],
-                                            "data": row
-                                        }
-                                    )
-                                    
-                                    self.market_signals.append(signal)
-                
+                        self.market_signals.append(signal)
+            
             except Exception as e:
                 LOG.log("signal_collection_error", source="dune", error=str(e))
             
@@ -259,6 +380,9 @@ class StrategyScoreboard:
         error: bool = False
     ):
         """Update strategy score based on performance."""
+        # one clock read and one isoformat per update
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
         if strategy_id not in self.scores:
             self.scores[strategy_id] = StrategyScore(
                 strategy_id=strategy_id,
@@ -270,10 +394,10 @@ class StrategyScoreboard:
                 success_rate=0.0,
                 edge_decay_factor=1.0,
                 last_opportunity=None,
-                last_update=datetime.now(timezone.utc).isoformat(),
+                last_update=now_iso,
                 status=StrategyStatus.ACTIVE,
-                performance_trend=[],
-                signal_scores=defaultdict(float)
+                performance_trend=deque(maxlen=7),
+                signal_scores={}
             )
         
         score = self.scores[strategy_id]
@@ -291,20 +415,19 @@ class StrategyScoreboard:
         # Update rates
         score.success_rate = score.captured_opportunities / score.total_opportunities
         if error:
-            score.error_rate = (score.error_rate * (score.total_opportunities - 1) + 1) / score.total_opportunities
-        else:
-            score.error_rate = (score.error_rate * (score.total_opportunities - 1)) / score.total_opportunities
+            score.error_count += 1
+        score.error_rate = score.error_count / score.total_opportunities
         
-        score.last_opportunity = datetime.now(timezone.utc).isoformat()
-        score.last_update = datetime.now(timezone.utc).isoformat()
+        score.last_opportunity = now_iso
+        score.last_update = now_iso
         
-        # Apply edge decay
-        self._apply_edge_decay(score)
+        # Apply edge decay; last_opportunity is ``now``, no need to re-parse it
+        self._apply_edge_decay(score, last_opp=now, now=now)
         
         # Check status transitions
         self._check_status_transition(score)
         
-        self._save_state()
+        self._dirty = True
         
         LOG.log(
             "strategy_score_updated",
@@ -314,26 +437,38 @@ class StrategyScoreboard:
             status=score.status.value
         )
     
-    def _apply_edge_decay(self, score: StrategyScore):
-        """Apply time-based decay to strategy edge."""
+    def _apply_edge_decay(
+        self,
+        score: StrategyScore,
+        last_opp: Optional[datetime] = None,
+        now: Optional[datetime] = None
+    ):
+        """Apply time-based decay to strategy edge.
+
+        ``last_opp`` and ``now`` let a caller that already holds the parsed
+        timestamps skip re-parsing ``score.last_opportunity``.
+        """
         if score.last_opportunity:
-            last_opp = datetime.fromisoformat(score.last_opportunity)
-            days_since = (datetime.now(timezone.utc) - last_opp).days
+            if last_opp is None:
+                last_opp = datetime.fromisoformat(score.last_opportunity)
+            days_since = ((now or datetime.now(timezone.utc)) - last_opp).days
             
             # Apply daily decay
-            score.edge_decay_factor = self.decay_rate ** days_since
-            
-            # Decay affects effective success rate
-            effective_success = score.success_rate * score.edge_decay_factor
-            
-            # Update performance trend
-            score.performance_trend.append(effective_success)
-            if len(score.performance_trend) > 7:
-                score.performance_trend = score.performance_trend[-7:]
+            if 0 <= days_since < len(self._decay_lut):
+                score.edge_decay_factor = self._decay_lut[days_since]
+            else:
+                score.edge_decay_factor = self.decay_rate ** days_since
+        
+        # Decay affects effective success rate; cached for every reader
+        score.effective_score = score.success_rate * score.edge_decay_factor
+        
+        # Update performance trend
+        if score.last_opportunity:
+            score.performance_trend.append(score.effective_score)
     
     def _check_status_transition(self, score: StrategyScore):
         """Check if strategy should transition status."""
-        effective_score = score.success_rate * score.edge_decay_factor
+        effective_score = score.effective_score
         
         if score.status == StrategyStatus.ACTIVE:
             if effective_score < self.probation_threshold:
@@ -362,54 +497,89 @@ class StrategyScoreboard:
             elif effective_score < self.prune_threshold:
                 score.status = StrategyStatus.DEPRECATED
     
-    def benchmark_against_signals(self, strategy_id: str, time_window_hours: int = 24) -> Dict[str, float]:
-        """Benchmark strategy against market signals."""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
-        recent_signals = [s for s in self.market_signals if s.timestamp > cutoff]
-        
-        if not recent_signals:
-            return {}
-        
-        score = self.scores.get(strategy_id)
-        if not score:
-            return {}
-        
-        # Group signals by source
-        signals_by_source = defaultdict(list)
-        for signal in recent_signals:
-            signals_by_source[signal.source].append(signal)
+    def _signal_totals(self, cutoff: datetime, time_window_hours: int) -> Dict[SignalSource, float]:
+        """Total signal value by source since ``cutoff``, in one pass.
+
+        Bursts of calls (one per strategy, CLI refreshes) reuse the last result
+        for up to ``SIGNAL_TOTALS_TTL`` seconds. Any append to the signal
+        buffer changes its length or newest entry and so invalidates it.
+        """
+        signals = self.market_signals
+        key = (
+            time_window_hours,
+            int(time.monotonic() // SIGNAL_TOTALS_TTL),
+            len(signals),
+            id(signals[-1]) if signals else None,
+        )
+        cached = self._totals_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        totals: Dict[SignalSource, float] = {}
+        for signal in signals:
+            if signal.timestamp > cutoff:
+                totals[signal.source] = totals.get(signal.source, 0.0) + signal.opportunity_value_eth
+        self._totals_cache = (key, totals)
+        return totals
+    
+    def _benchmark_score(
+        self,
+        score: StrategyScore,
+        totals: Dict[SignalSource, float],
+        cutoff: datetime
+    ) -> Dict[str, float]:
+        """Benchmark one strategy against precomputed per-source ``totals``."""
+        # Estimate captured value (simplified - in production, match actual trades).
+        # The capture rate does not depend on the source, so work it out once.
+        capture_rate = 0.0
+        if score.last_opportunity:
+            last_opp_time = datetime.fromisoformat(score.last_opportunity)
+            if last_opp_time > cutoff:
+                # Assume strategy captured proportional value
+                capture_rate = score.effective_score
         
         # Calculate capture rate by source
         benchmark_scores = {}
         
-        for source, signals in signals_by_source.items():
-            total_value = sum(s.opportunity_value_eth for s in signals)
-            
-            # Estimate captured value (simplified - in production, match actual trades)
-            if score.last_opportunity:
-                last_opp_time = datetime.fromisoformat(score.last_opportunity)
-                if last_opp_time > cutoff:
-                    # Assume strategy captured proportional value
-                    capture_rate = score.success_rate * score.edge_decay_factor
-                    captured_value = total_value * capture_rate * 0.1  # Conservative estimate
-                else:
-                    captured_value = 0
-            else:
-                captured_value = 0
-            
+        for source, total_value in totals.items():
+            captured_value = total_value * capture_rate * 0.1  # Conservative estimate
             benchmark_scores[source.value] = captured_value / max(total_value, 0.001)
             score.signal_scores[source.value] = benchmark_scores[source.value]
         
         return benchmark_scores
     
+    def benchmark_against_signals(self, strategy_id: str, time_window_hours: int = 24) -> Dict[str, float]:
+        """Benchmark strategy against market signals."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+        score = self.scores.get(strategy_id)
+        if not score:
+            return {}
+        
+        totals = self._signal_totals(cutoff, time_window_hours)
+        if not totals:
+            return {}
+        
+        return self._benchmark_score(score, totals, cutoff)
+    
+    def benchmark_all(self, time_window_hours: int = 24) -> Dict[str, Dict[str, float]]:
+        """Benchmark every strategy, scanning the signal buffer only once.
+
+        Equivalent to calling :meth:`benchmark_against_signals` per strategy.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+        totals = self._signal_totals(cutoff, time_window_hours)
+        if not totals:
+            return {strategy_id: {} for strategy_id in self.scores}
+        return {
+            strategy_id: self._benchmark_score(score, totals, cutoff)
+            for strategy_id, score in self.scores.items()
+        }
+    
     def get_pruning_candidates(self) -> List[str]:
         """Get strategies that should be pruned."""
         candidates = []
         
         for strategy_id, score in self.scores.items():
-            effective_score = score.success_rate * score.edge_decay_factor
-            
-            if score.status == StrategyStatus.DEPRECATED or effective_score < self.prune_threshold:
+            if score.status == StrategyStatus.DEPRECATED or score.effective_score < self.prune_threshold:
                 candidates.append(strategy_id)
         
         return candidates
@@ -451,16 +621,10 @@ class StrategyScoreboard:
             candidate_count=len(pruning_candidates)
         )
         
-        # Wait for quorum (in production, this would be async)
+        # Wait for quorum; wakes as soon as the deciding vote is cast
         max_wait = 3600  # 1 hour
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait:
-            if self.voting_quorum.quorum_met(proposal_id):
-                break
-            await asyncio.sleep(60)
         
-        if not self.voting_quorum.quorum_met(proposal_id):
+        if not await self.voting_quorum.wait_for_quorum(proposal_id, max_wait):
             LOG.log("pruning_quorum_timeout", proposal_id=proposal_id)
             return {"pruned": [], "message": "Quorum not reached"}
         
@@ -500,26 +664,25 @@ class StrategyScoreboard:
             **kwargs
         }
         
-        with open(MUTATION_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_json_line(MUTATION_LOG_FILE, entry)
     
     def get_leaderboard(self, top_n: int = 10) -> List[Dict[str, Any]]:
         """Get top performing strategies."""
-        active_scores = [
+        active_scores = (
             score for score in self.scores.values()
-            if score.status in [StrategyStatus.ACTIVE, StrategyStatus.PROBATION]
-        ]
+            if score.status in _LEADERBOARD_STATUSES
+        )
         
-        # Sort by effective score
-        sorted_scores = sorted(
+        # Top ``top_n`` by effective score; same order as a full reverse sort
+        top_scores = heapq.nlargest(
+            top_n,
             active_scores,
-            key=lambda s: s.success_rate * s.edge_decay_factor * (1 + s.total_profit_eth),
-            reverse=True
+            key=lambda s: s.effective_score * (1 + s.total_profit_eth)
         )
         
         leaderboard = []
-        for i, score in enumerate(sorted_scores[:top_n]):
-            effective_score = score.success_rate * score.edge_decay_factor
+        for i, score in enumerate(top_scores):
+            effective_score = score.effective_score
             
             leaderboard.append({
                 "rank": i + 1,
@@ -537,19 +700,29 @@ class StrategyScoreboard:
     
     def export_metrics(self) -> Dict[str, Any]:
         """Export metrics for Grafana dashboard."""
+        # One pass over scores and one over signals instead of a pass per field
+        status_counts = dict.fromkeys(StrategyStatus, 0)
+        total_profit = success_sum = latency_sum = 0.0
+        for s in self.scores.values():
+            status_counts[s.status] += 1
+            total_profit += s.total_profit_eth
+            success_sum += s.success_rate
+            latency_sum += s.avg_latency_ms
+        signal_counts = dict.fromkeys(SignalSource, 0)
+        for signal in self.market_signals:
+            signal_counts[signal.source] += 1
+        n = len(self.scores)
+        
         metrics = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "total_strategies": len(self.scores),
-            "active_strategies": sum(1 for s in self.scores.values() if s.status == StrategyStatus.ACTIVE),
-            "probation_strategies": sum(1 for s in self.scores.values() if s.status == StrategyStatus.PROBATION),
-            "deprecated_strategies": sum(1 for s in self.scores.values() if s.status == StrategyStatus.DEPRECATED),
-            "total_profit_eth": sum(s.total_profit_eth for s in self.scores.values()),
-            "avg_success_rate": np.mean([s.success_rate for s in self.scores.values()]) if self.scores else 0,
-            "avg_latency_ms": np.mean([s.avg_latency_ms for s in self.scores.values()]) if self.scores else 0,
-            "signal_counts": {
-                source.value: len([s for s in self.market_signals if s.source == source])
-                for source in SignalSource
-            },
+            "total_strategies": n,
+            "active_strategies": status_counts[StrategyStatus.ACTIVE],
+            "probation_strategies": status_counts[StrategyStatus.PROBATION],
+            "deprecated_strategies": status_counts[StrategyStatus.DEPRECATED],
+            "total_profit_eth": total_profit,
+            "avg_success_rate": success_sum / n if n else 0,
+            "avg_latency_ms": latency_sum / n if n else 0,
+            "signal_counts": {source.value: count for source, count in signal_counts.items()},
             "leaderboard": self.get_leaderboard()
         }
         
@@ -653,8 +826,7 @@ async def scoreboard_cli():
         
         elif choice == "5":
             print("\nBenchmarking all strategies...")
-            for strategy_id in scoreboard.scores:
-                benchmarks = scoreboard.benchmark_against_signals(strategy_id)
+            for strategy_id, benchmarks in scoreboard.benchmark_all().items():
                 print(f"\n{strategy_id}:")
                 for source, score in benchmarks.items():
                     print(f"  {source}: {score:.2%}")
@@ -665,6 +837,7 @@ async def scoreboard_cli():
         else:
             print("Invalid option")
     
+    await scoreboard.close()
     print("\nGoodbye!")
 
 
@@ -16,7 +16,6 @@ Simulation/test hooks and kill conditions:
 - export_drp aggregates logs and nonce snapshots into an archive.
 """
 
-import json
 import logging
 import os
 import tarfile
@@ -26,7 +25,7 @@ from typing import Any, cast, SupportsIndex
 
 from .kill_switch import kill_switch_triggered, record_kill_event
 from .nonce_manager import NonceManager
-from core.logger import log_error, make_json_safe
+from core.logger import append_json_line, flush_logs, log_error, make_json_safe
 from agents.agent_registry import get_value
 
 
@@ -69,8 +68,11 @@ class TransactionBuilder:
     def _log(self, entry: dict[str, Any]) -> None:
         """Append ``entry`` as a JSON line to the transaction log."""
 
-        with self.log_file.open("a") as fh:
-            fh.write(json.dumps(make_json_safe(entry)) + "\n")
+        append_json_line(self.log_file, make_json_safe(entry))
+        if entry.get("error") or entry.get("kill_triggered"):
+            # with MEVOG_ASYNC_LOG the line is only queued; make failures and
+            # kills durable before the caller raises
+            flush_logs()
         if entry.get("error"):
             log_error(
                 "TransactionBuilder",
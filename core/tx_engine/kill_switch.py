@@ -1,6 +1,7 @@
 """Kill switch utilities for halting transaction execution."""
 
 import os
+import time
 from pathlib import Path
 
 from core.logger import StructuredLogger, log_error
@@ -8,6 +9,10 @@ import json
 from datetime import datetime
 
 ENV_VAR = "KILL_SWITCH"
+# how long a flag-file check is reused (seconds); the env var is always re-read
+_FLAG_TTL = float(os.getenv("KILL_SWITCH_TTL", "0.1"))
+# (flag path, expiry on the monotonic clock, flag present)
+_flag_cache: tuple[str, float, bool] | None = None
 
 
 def _flag_file() -> Path:
@@ -42,11 +47,32 @@ def init_kill_switch() -> None:
         lf.touch()
 
 
+def _invalidate() -> None:
+    """Forget the cached flag-file check so the next call stats the file."""
+    global _flag_cache
+    _flag_cache = None
+
+
+def _flag_active() -> bool:
+    """Return whether the flag file exists, re-checking at most every ``_FLAG_TTL``."""
+    global _flag_cache
+    path = str(_flag_file())
+    now = time.monotonic()
+    cached = _flag_cache
+    if cached is not None and cached[0] == path and now < cached[1]:
+        return cached[2]
+    active = os.path.exists(path)
+    _flag_cache = (path, now + _FLAG_TTL, active)
+    return active
+
+
 def kill_switch_triggered() -> bool:
-    """Check if kill switch is active via environment or flag file."""
-    env_active = os.getenv(ENV_VAR) == "1"
-    file_active = _flag_file().exists()
-    return env_active or file_active
+    """Check if kill switch is active via environment or flag file.
+
+    The flag file is stat'ed at most once per ``KILL_SWITCH_TTL`` seconds
+    (default 0.1) so per-transaction checks stay off the filesystem.
+    """
+    return os.getenv(ENV_VAR) == "1" or _flag_active()
 
 
 def record_kill_event(origin_module: str, snapshot_path: str | None = None) -> None:
@@ -106,6 +132,7 @@ def clear_kill_switch() -> None:
     except Exception:
         pass
     os.environ.pop(ENV_VAR, None)
+    _invalidate()
 
 
 def record_recovery_event(origin_module: str) -> None:
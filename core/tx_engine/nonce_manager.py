@@ -14,14 +14,33 @@ Simulation/test hooks and kill conditions:
 - Snapshot and restore functions support DRP state export.
 """
 
+import atexit
 import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 import threading
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Set
 
-from core.logger import log_error, make_json_safe
+try:  # pragma: no cover - optional speedup
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to json
+    orjson = None  # type: ignore
+
+from core.logger import append_json_line, log_error, make_json_safe
+
+
+def _write_atomic(path: Path, nonces: Dict[str, int]) -> None:
+    """Write ``nonces`` as JSON via a sibling temp file and ``os.replace``.
+
+    Readers (and a crash mid-write) never see a truncated file.
+    """
+
+    payload = orjson.dumps(nonces) if orjson is not None else json.dumps(nonces).encode()
+    # unique per writer: managers sharing a cache file lock independently
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
 
 
 class NonceManager:
@@ -46,7 +65,15 @@ class NonceManager:
         # reentrant lock protecting all nonce state mutations/reads
         self._nonce_lock = threading.RLock()
         self._nonces: Dict[str, int] = {}
+        # addresses whose nonce came from disk and has not been checked
+        # against the chain yet; see get_nonce
+        self._unverified: Set[str] = set()
+        # the cache file is rewritten once per ``_flush_every`` changes instead
+        # of on every nonce; flush() (also run at exit) writes the remainder
+        self._flush_every = max(1, int(os.getenv("NONCE_FLUSH_EVERY", "32")))
+        self._pending = 0
         self._load_cache()
+        atexit.register(self.flush)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -57,11 +84,13 @@ class NonceManager:
         with self._nonce_lock:
             if self.cache_path.exists():
                 try:
-                    data = json.loads(self.cache_path.read_text())
+                    raw = self.cache_path.read_bytes()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     self._nonces = {k: int(v) for k, v in data.items()}
                 except Exception as exc:
                     self._nonces = {}
                     log_error("NonceManager", f"load_cache failed: {exc}")
+                self._unverified = set(self._nonces)
             else:
                 self.cache_path.write_text("{}")
 
@@ -69,20 +98,32 @@ class NonceManager:
         """Persist nonce cache to disk under lock."""
         with self._nonce_lock:
             try:
-                with self.cache_path.open("w") as fh:
-                    json.dump(self._nonces, fh)
+                _write_atomic(self.cache_path, self._nonces)
+                self._pending = 0
             except Exception as exc:
                 log_error("NonceManager", f"save_cache failed: {exc}")
 
-    def _fetch_onchain_nonce(self, address: str) -> int:
-        """Fetch the current on-chain nonce for ``address``."""
+    def _mark_dirty(self) -> None:
+        """Record a cache change; persist once enough have accumulated."""
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self._save_cache()
+
+    def _fetch_onchain_nonce(self, address: str, pending: bool = False) -> Optional[int]:
+        """Fetch the current on-chain nonce for ``address``.
+
+        ``pending`` also counts transactions still in the mempool. Returns
+        ``None`` if the RPC call fails, and 0 without a web3 client.
+        """
         if self.web3 is None or not hasattr(self.web3, "eth"):
             return 0
         try:
+            if pending:
+                return int(self.web3.eth.get_transaction_count(address, "pending"))
             return int(self.web3.eth.get_transaction_count(address))
-        except Exception as exc:  # pragma: no cover - RPC failure
+        except Exception as exc:
             log_error("NonceManager", f"rpc nonce fetch failed: {exc}")
-            return 0
+            return None
 
     def _log(
         self,
@@ -102,8 +143,7 @@ class NonceManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "source": source,
         }
-        with self.log_path.open("a") as fh:
-            fh.write(json.dumps(make_json_safe(entry)) + "\n")
+        append_json_line(self.log_path, make_json_safe(entry))
 
     # ------------------------------------------------------------------
     # Public API
@@ -114,11 +154,19 @@ class NonceManager:
             if address in self._nonces:
                 local_nonce = self._nonces[address] + 1
                 on_chain = None
+                if address in self._unverified:
+                    # the cache is flushed in batches, so after a crash it can
+                    # lag nonces already broadcast; never go below the chain.
+                    # If the RPC is down, check again on the next call
+                    on_chain = self._fetch_onchain_nonce(address, pending=True)
+                    if on_chain is not None:
+                        self._unverified.discard(address)
+                        local_nonce = max(local_nonce, on_chain)
             else:
                 on_chain = self._fetch_onchain_nonce(address)
-                local_nonce = on_chain
+                local_nonce = on_chain if on_chain is not None else 0
             self._nonces[address] = local_nonce
-            self._save_cache()
+            self._mark_dirty()
             self._log("get", address, on_chain, local_nonce, tx_id)
             return local_nonce
 
@@ -129,7 +177,8 @@ class NonceManager:
         """Manually set ``nonce`` for ``address`` and persist to cache."""
         with self._nonce_lock:
             self._nonces[address] = int(nonce)
-            self._save_cache()
+            self._unverified.discard(address)
+            self._mark_dirty()
             on_chain = self._fetch_onchain_nonce(address)
             self._log("update", address, on_chain, int(nonce), tx_id)
 
@@ -137,15 +186,24 @@ class NonceManager:
         """Remove cached nonce for ``address`` to resync with chain."""
         with self._nonce_lock:
             self._nonces.pop(address, None)
-            self._save_cache()
+            self._unverified.discard(address)
+            self._mark_dirty()
             on_chain = self._fetch_onchain_nonce(address)
             self._log("reset", address, on_chain, None, tx_id)
 
+    def flush(self) -> None:
+        """Write pending nonce changes to the cache file."""
+
+        with self._nonce_lock:
+            if self._pending:
+                self._save_cache()
+
     def snapshot(self, path: str) -> None:
         """Write nonce snapshot to ``path``."""
 
-        with self._nonce_lock, open(path, "w") as fh:
-            json.dump(self._nonces, fh)
+        self.flush()
+        with self._nonce_lock:
+            _write_atomic(Path(path), self._nonces)
 
     def restore(self, path: str) -> None:
         """Restore nonce snapshot from ``path``."""
@@ -154,6 +212,7 @@ class NonceManager:
             data = json.load(fh)
         with self._nonce_lock:
             self._nonces = {k: int(v) for k, v in data.items()}
+            self._unverified = set(self._nonces)
             self._save_cache()
 
     # ------------------------------------------------------------------
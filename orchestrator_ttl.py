@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from core.logger import StructuredLogger, log_error
 
@@ -14,6 +14,8 @@ try:
 except Exception:  # pragma: no cover - optional
     yaml = None  # type: ignore
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 
 class StrategyTTLManager:
     """Enforce per-strategy TTL based on ``EDGE_SCHEMA`` metadata."""
@@ -21,6 +23,8 @@ class StrategyTTLManager:
     def __init__(self, orchestrator: Any | None = None) -> None:
         self.logger = StructuredLogger("strategy_ttl")
         self.orchestrator = orchestrator
+        # parsed EDGE_SCHEMA per strategy file, keyed on (mtime_ns, size)
+        self._schema_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     def _simple_yaml_load(self, text: str) -> Dict[str, Any]:
@@ -59,6 +63,15 @@ class StrategyTTLManager:
 
     # ------------------------------------------------------------------
     def _read_edge_schema(self, path: Path) -> Dict[str, Any]:
+        st = path.stat()
+        hit = self._schema_cache.get(path)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        schema = self._parse_edge_schema(path)
+        self._schema_cache[path] = (st.st_mtime_ns, st.st_size, schema)
+        return schema
+
+    def _parse_edge_schema(self, path: Path) -> Dict[str, Any]:
         text = path.read_text(encoding="utf-8")
         delim = '"""'
         idx = text.find(delim)
@@ -70,7 +83,7 @@ class StrategyTTLManager:
         block = text[idx + 3 : end]
         if yaml is not None:
             try:
-                data = yaml.safe_load(block)
+                data = yaml.load(block, Loader=_YAML_LOADER)
                 return data or {}
             except Exception:
                 pass
@@ -28,7 +28,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 import sys
 import time
@@ -213,6 +213,8 @@ class CrossDomainArb(BaseStrategy):
         nonce_manager: NonceManager | None = None,
         prune_epochs: int | None = None,
         capital_base_eth: float = 1.0,
+        bridge_addrs: Optional[List[str]] = None,
+        mempool_ws_url: str | None = None,
     ) -> None:
         super().__init__(STRATEGY_ID, prune_epochs=prune_epochs, log_file=str(LOG_FILE))
         self.feed = UniswapV3Feed()
@@ -233,7 +235,13 @@ class CrossDomainArb(BaseStrategy):
         self.sample_tx = HexBytes(b"\x01")
 
         self.intent_feed = IntentFeed()
-        self.mempool_monitor = MempoolMonitor(w3)
+        # pending txs are pushed over a websocket when one is configured and
+        # polled over HTTP otherwise; only txs to ``bridge_addrs`` count
+        self.mempool_monitor = MempoolMonitor(
+            w3,
+            bridge_addrs=bridge_addrs,
+            ws_url=mempool_ws_url or os.getenv("MEMPOOL_WS_URL"),
+        )
         self.node_selector = NodeSelector(nodes or {}) if nodes else None
         self.flashloan = FlashloanAdapter(os.getenv("FLASHLOAN_API", "http://localhost:9001"))
         self.pool_scanner = PoolScanner(os.getenv("POOL_SCANNER_API", "http://localhost:9002"))
@@ -319,7 +327,7 @@ class CrossDomainArb(BaseStrategy):
     def _check_l1_sandwich(self) -> bool:
         if not self.edges_enabled.get("l1_sandwich", True):
             return True
-        for tx in self.mempool_monitor.listen_bridge_txs(limit=1):
+        for tx in self.mempool_monitor.pending_bridge_txs(limit=1):
             pre = os.getenv("CROSS_ARB_STATE_PRE", "state/cross_arb_pre.json")
             post = os.getenv("CROSS_ARB_STATE_POST", "state/cross_arb_post.json")
             tx_pre = os.getenv("CROSS_ARB_TX_PRE", "state/tx_pre.json")
@@ -356,7 +364,7 @@ class CrossDomainArb(BaseStrategy):
                 "sandwich",
                 tx_id=str(front),
                 related=str(back),
-                bridge_tx=str(tx.get("hash")),
+                bridge_tx=str(tx.hash),
                 strategy_id=EDGE_SCHEMA["strategy_id"],
                 mutation_id=os.getenv("MUTATION_ID", "dev"),
                 risk_level="low",
@@ -378,7 +386,7 @@ class CrossDomainArb(BaseStrategy):
                 log_error(EDGE_SCHEMA["strategy_id"], f"intent fetch: {exc}", event="intent_fetch", domain=domain)
                 continue
             for intent in intents:
-                dest = classify_intent(intent.__dict__)
+                dest = classify_intent(asdict(intent))
                 LOG.log(
                     "intent_route",
                     intent_id=intent.intent_id,
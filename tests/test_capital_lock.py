@@ -40,3 +40,25 @@ def test_unlock_requires_founder(monkeypatch, tmp_path):
     assert entries[-1]["event"] == "unlock_rejected"
     assert entries[-1]["trace_id"] == "nope"
 
+
+
+def test_record_trade_threadsafe(monkeypatch, tmp_path):
+    import threading
+
+    monkeypatch.setenv("CAPITAL_LOCK_LOG", str(tmp_path / "lock.json"))
+    lock = CapitalLock(max_drawdown_pct=100, max_loss_usd=1e9, balance_usd=1000)
+
+    def worker():
+        for _ in range(500):
+            lock.record_trade(1.0)
+            lock.record_trade(-1.0)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(lock.trades) == 8000
+    assert lock.balance_usd == 1000
+    assert lock.losses == 4000
+    assert lock.trade_allowed()
@@ -22,3 +22,12 @@ def test_log_error_non_serializable(tmp_path, monkeypatch):
     log_error("test_mod", "boom", detail=Dummy())
     entry = json.loads(err_file.read_text().splitlines()[0])
     assert entry["detail"] == "<Dummy>"
+
+
+def test_log_set_and_tuple_keys(tmp_path):
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("safe", log_file=str(log_file))
+    logger.log("event", tags={"a"}, pairs={("x", "y"): 1})
+    data = json.loads(log_file.read_text().splitlines()[0])
+    assert data["tags"] == ["a"]
+    assert data["pairs"] == {"('x', 'y')": 1}
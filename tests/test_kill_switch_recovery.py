@@ -26,3 +26,22 @@ def test_record_recovery(tmp_path, monkeypatch):
     data = [json.loads(line) for line in log_file.read_text().splitlines()]
     assert data[-1]["origin_module"] == "test"
     assert data[-1]["kill_event"] is False
+
+
+def test_flag_file_check_cached(tmp_path, monkeypatch):
+    flag_file = tmp_path / "flag.txt"
+    monkeypatch.setenv("KILL_SWITCH_FLAG_FILE", str(flag_file))
+    monkeypatch.delenv("KILL_SWITCH", raising=False)
+    importlib.reload(ks)
+    monkeypatch.setattr(ks, "_FLAG_TTL", 60.0)
+
+    assert ks.kill_switch_triggered() is False
+    flag_file.write_text("1")
+    assert ks.kill_switch_triggered() is False  # within TTL, no stat
+    monkeypatch.setenv("KILL_SWITCH", "1")
+    assert ks.kill_switch_triggered() is True  # env var is never cached
+    monkeypatch.delenv("KILL_SWITCH")
+    ks._invalidate()
+    assert ks.kill_switch_triggered() is True
+    ks.clear_kill_switch()
+    assert ks.kill_switch_triggered() is False
@@ -43,3 +43,202 @@ def test_structured_logging(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     err = json.loads(err_lines[0])
     assert err["error"] == "boom"
     assert err["module"] == "test_mod"
+
+
+def test_empty_fields_omitted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRACE_ID", raising=False)
+    monkeypatch.delenv("BLOCK", raising=False)
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file))
+    logger.log("event", risk_level="low")
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["risk_level"] == "low"
+    for key in ("tx_id", "strategy_id", "mutation_id", "block", "error", "trace_id"):
+        assert key not in entry
+
+
+def test_async_write_flush(tmp_path: Path) -> None:
+    from core.logger import flush_logs
+
+    log_file = tmp_path / "async.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file), async_write=True)
+    for i in range(50):
+        logger.log("event", seq=i)
+    assert flush_logs()
+
+    data = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [d["seq"] for d in data] == list(range(50))
+
+
+def test_wide_int_serialized(tmp_path: Path) -> None:
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file))
+    logger.log("event", value=10**30)
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["value"] == 10**30
+
+
+def test_reopen_after_rotation(tmp_path: Path) -> None:
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file))
+    logger.log("first")
+    log_file.rename(tmp_path / "log.json.1")
+    logger.reopen()
+    logger.log("second")
+    logger.close()
+
+    assert json.loads(log_file.read_text())["event"] == "second"
+    assert json.loads((tmp_path / "log.json.1").read_text())["event"] == "first"
+
+
+def test_follows_external_rotation(tmp_path: Path) -> None:
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file))
+    logger.log("first")
+    log_file.rename(tmp_path / "log.json.1")  # logrotate / mv, no reopen()
+    logger.log("second")
+    log_file.unlink()
+    logger.log("third")
+    logger.close()
+
+    assert json.loads(log_file.read_text())["event"] == "third"
+    assert json.loads((tmp_path / "log.json.1").read_text())["event"] == "first"
+
+
+def test_refresh_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRACE_ID", raising=False)
+    log_file = tmp_path / "log.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file))
+    monkeypatch.setenv("TRACE_ID", "t1")
+    logger.log("before")
+    logger.refresh_env()
+    logger.log("after")
+
+    first, second = (json.loads(line) for line in log_file.read_text().splitlines())
+    assert "trace_id" not in first
+    assert second["trace_id"] == "t1"
+    assert second["module"] == "test_mod"
+
+
+def test_cached_timestamp_format() -> None:
+    from core.logger import _utc_timestamp
+
+    first = datetime.fromisoformat(_utc_timestamp())
+    second = datetime.fromisoformat(_utc_timestamp())
+    assert first.tzinfo is not None and first.utcoffset().total_seconds() == 0
+    assert second >= first
+
+
+def test_writer_linger_batches(tmp_path: Path) -> None:
+    from core.logger import _LogWriter
+
+    writer = _LogWriter(max_batch=4, linger=0.01)
+    log_file = tmp_path / "batched.json"
+    for i in range(10):
+        writer.submit((log_file, b'{"seq":%d}\n' % i))
+    assert writer.flush()
+    assert [json.loads(line)["seq"] for line in log_file.read_text().splitlines()] == list(range(10))
+
+
+def test_writev_respects_iov_max(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import os
+
+    import core.logger as logger_mod
+
+    monkeypatch.setattr(logger_mod, "_IOV_MAX", 3)
+    path = tmp_path / "v.log"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        logger_mod._writev_all(fd, [b"%d\n" % i for i in range(10)])
+    finally:
+        os.close(fd)
+    assert path.read_text().split() == [str(i) for i in range(10)]
+
+
+def test_log_error_sampling(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import core.logger as logger_mod
+
+    err_file = tmp_path / "errors.log"
+    monkeypatch.setenv("ERROR_LOG_FILE", str(err_file))
+    monkeypatch.setattr(logger_mod, "_ERR_BURST", 3)
+    clock = [100.0]
+    monkeypatch.setattr(logger_mod.time, "monotonic", lambda: clock[0])
+
+    for _ in range(10):
+        logger_mod.log_error("rpc", "rpc_fail")
+    assert len(err_file.read_text().splitlines()) == 3
+
+    clock[0] += 1.5
+    logger_mod.log_error("rpc", "rpc_fail")
+    lines = [json.loads(line) for line in err_file.read_text().splitlines()]
+    assert len(lines) == 4
+    assert lines[-1]["repeated"] == 7
+
+
+def test_alerts_sent_off_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    import core.logger as logger_mod
+
+    sent = threading.Event()
+    callers = []
+
+    class FakeRequests:
+        @staticmethod
+        def post(url, json=None, timeout=None):
+            callers.append(threading.current_thread().name)
+            sent.set()
+
+    monkeypatch.setattr(logger_mod, "requests", FakeRequests)
+    monkeypatch.setattr(logger_mod, "_ALERT_WEBHOOKS", ["http://hook"])
+    logger_mod._send_alert("boom")
+    assert sent.wait(2)
+    assert callers == ["ops-alert-sender"]
+
+
+@pytest.mark.parametrize("async_write", [False, True])
+def test_size_rotation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, async_write: bool) -> None:
+    import core.logger as logger_mod
+
+    monkeypatch.setattr(logger_mod, "_LOG_MAX_BYTES", 200)
+    log_file = tmp_path / "rot.json"
+    logger = StructuredLogger("test_mod", log_file=str(log_file), async_write=async_write)
+    for i in range(20):
+        logger.log("event", seq=i)
+        if async_write:
+            logger_mod.flush_logs()
+    logger.close()
+
+    files = sorted(tmp_path.glob("rot.json*"))
+    assert len(files) > 1
+    seqs = sorted(
+        json.loads(line)["seq"] for f in files for line in f.read_text().splitlines()
+    )
+    assert seqs == list(range(20))
+
+
+
+@pytest.mark.parametrize("async_b", [False, True])
+def test_rotation_with_shared_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, async_b: bool) -> None:
+    import core.logger as logger_mod
+
+    monkeypatch.setattr(logger_mod, "_LOG_MAX_BYTES", 400)
+    log_file = tmp_path / "x.json"
+    a = StructuredLogger("a", log_file=str(log_file))
+    b = StructuredLogger("b", log_file=str(log_file), async_write=async_b)
+    for i in range(30):
+        a.log("event", seq=i)
+        b.log("event", seq=i)
+        logger_mod.flush_logs()
+    a.close()
+    b.close()
+
+    files = list(tmp_path.glob("x.json*"))
+    assert len(files) > 2
+    # every file stays near the limit: nobody keeps appending to an archive
+    for f in files:
+        assert f.stat().st_size < 400 + 200
+    lines = [json.loads(line) for f in files for line in f.read_text().splitlines()]
+    assert sorted(e["seq"] for e in lines if e["module"] == "b") == list(range(30))
@@ -0,0 +1,145 @@
+"""Tests for MempoolMonitor transaction fetching."""
+
+import asyncio
+
+import core.mempool_monitor as mm
+from core.mempool_monitor import MempoolMonitor
+
+
+class _Filter:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def get_new_entries(self):
+        return self.batches.pop(0) if self.batches else []
+
+
+class _Eth:
+    def __init__(self, txs, batches):
+        self.txs = txs
+        self.batches = batches
+        self.lookups = 0
+
+    def filter(self, _kind):
+        return _Filter(self.batches)
+
+    def get_transaction(self, h):
+        self.lookups += 1
+        return self.txs[bytes(h)]
+
+
+class _Web3:
+    def __init__(self, txs, batches):
+        self.eth = _Eth(txs, batches)
+
+
+def test_listen_bridge_txs_skips_empty_polls():
+    txs = {
+        b"a": {"hash": b"a", "to": "0x1"},
+        b"b": {"hash": b"b", "to": None},
+        b"c": {"hash": b"c", "to": "0x2"},
+    }
+    w3 = _Web3(txs, [[], [b"a", b"b"], [], [b"c"]])
+    monitor = MempoolMonitor(w3)
+    result = monitor.listen_bridge_txs(limit=2)
+    assert [tx.hash for tx in result] == [b"a", b"c"]
+    assert w3.eth.lookups == 3
+
+
+def test_listen_bridge_txs_filters_bridges():
+    txs = {
+        b"a": {"hash": b"a", "to": "0xAbC"},
+        b"b": {"hash": b"b", "to": "0xdef"},
+    }
+    w3 = _Web3(txs, [[b"a", b"b"], [b"a"]])
+    monitor = MempoolMonitor(w3, bridge_addrs=["0xabc"])
+    result = monitor.listen_bridge_txs(limit=2)
+    assert [tx.hash for tx in result] == [b"a", b"a"]
+
+
+class _WsEth:
+    def __init__(self, txs):
+        self.txs = txs
+        self.subscribed = []
+
+    async def subscribe(self, kind, full):
+        self.subscribed.append((kind, full))
+
+    async def get_transaction(self, h):
+        return self.txs[h]
+
+
+class _Ws:
+    def __init__(self, msgs):
+        self.msgs = msgs
+
+    async def process_subscriptions(self):
+        for msg in self.msgs:
+            yield {"result": msg}
+
+
+class _AsyncW3:
+    def __init__(self, msgs, txs):
+        self.eth = _WsEth(txs)
+        self.ws = _Ws(msgs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeAsyncWeb3:
+    def __init__(self, msgs, txs=None, fail=False):
+        self.msgs = msgs
+        self.txs = txs or {}
+        self.fail = fail
+        self.urls = []
+        self.w3 = None
+
+    def persistent_websocket(self, url):
+        self.urls.append(url)
+        if self.fail:
+            raise ConnectionError("no websocket")
+        self.w3 = _AsyncW3(self.msgs, self.txs)
+        return self.w3
+
+
+def _patch_ws(monkeypatch, fake):
+    monkeypatch.setattr(mm, "AsyncWeb3", fake)
+    monkeypatch.setattr(mm, "WebsocketProviderV2", lambda url: url)
+
+
+def test_ws_listener_filters_and_resolves_hashes(monkeypatch):
+    fake = _FakeAsyncWeb3(
+        [
+            {"hash": b"a", "to": "0xdef"},
+            b"h",  # node pushed only the hash
+            {"hash": b"c", "to": "0xABC"},
+        ],
+        txs={b"h": {"hash": b"b", "to": "0xabc"}},
+    )
+    _patch_ws(monkeypatch, fake)
+    monitor = MempoolMonitor(None, bridge_addrs=["0xabc"])
+    result = asyncio.run(monitor.listen_bridge_txs_ws("wss://node", limit=2))
+    assert [tx.hash for tx in result] == [b"b", b"c"]
+    assert fake.w3.eth.subscribed == [("newPendingTransactions", True)]
+
+
+def test_pending_bridge_txs_prefers_ws(monkeypatch):
+    fake = _FakeAsyncWeb3([{"hash": b"a", "to": "0x1"}])
+    _patch_ws(monkeypatch, fake)
+    w3 = _Web3({}, [])
+    monitor = MempoolMonitor(w3, ws_url="wss://node")
+    assert [tx.hash for tx in monitor.pending_bridge_txs(limit=1)] == [b"a"]
+    assert fake.urls == ["wss://node"]
+    assert w3.eth.lookups == 0
+
+
+def test_pending_bridge_txs_falls_back_to_polling(monkeypatch):
+    _patch_ws(monkeypatch, _FakeAsyncWeb3([], fail=True))
+    w3 = _Web3({b"a": {"hash": b"a", "to": "0x1"}}, [[b"a"]])
+    monitor = MempoolMonitor(w3, ws_url="wss://node")
+    assert [tx.hash for tx in monitor.pending_bridge_txs(limit=1)] == [b"a"]
+    assert monitor.failures == 1
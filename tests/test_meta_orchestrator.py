@@ -18,7 +18,42 @@ class Dummy:
 
 
 def test_meta_cycle():
-    orch = MetaOrchestrator(Dummy, {"threshold": 0.1}, num_agents=2)
-    orch.run_cycle()
-    st = orch.status()
+    with MetaOrchestrator(Dummy, {"threshold": 0.1}, num_agents=2) as orch:
+        orch.run_cycle()
+        st = orch.status()
     assert st["active_agents"]
+
+
+def test_agent_ids_not_reused():
+    with MetaOrchestrator(Dummy, {"threshold": 0.1}, num_agents=2) as orch:
+        for _ in range(3):
+            orch.run_cycle()
+        st = orch.status()
+    assert not set(st["active_agents"]) & set(st["pruned_agents"])
+    assert len(set(st["pruned_agents"])) == len(st["pruned_agents"])
+
+
+def test_agent_failure_does_not_abort_cycle():
+    class Flaky(Dummy):
+        def run_once(self):
+            raise RuntimeError("rpc down")
+
+    with MetaOrchestrator(Flaky, {"threshold": 0.1}, num_agents=4) as orch:
+        orch.run_cycle()
+        assert len(orch.status()["active_agents"]) == 4
+
+
+def test_agents_get_own_param_containers():
+    class Keeper(Dummy):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.kwargs = kwargs
+
+    shared = object()
+    base = {"threshold": 0.1, "pools": {"eth": {"fee": 3}}, "lock": shared}
+    with MetaOrchestrator(Keeper, base, num_agents=2) as orch:
+        a, b = orch.active_agents.values()
+    assert a.kwargs["pools"] == b.kwargs["pools"] == base["pools"]
+    assert a.kwargs["pools"] is not b.kwargs["pools"]
+    assert a.kwargs["lock"] is b.kwargs["lock"] is shared
+    assert a.kwargs["nonce_manager"] is b.kwargs["nonce_manager"]
@@ -12,42 +12,13 @@ opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
 
 @pytest.fixture(autouse=True)
 def reset_metrics() -> None:
-    metrics._METRICS = {
-        "opportunities": 0,
-        "fails": 0,
-        "pnl": 0.0,
-        "spreads": [],
-        "latencies": [],
-        "alert_count": 0,
-        "strategy_scores": {},
-        "prune_total": 0,
-        "decay_alerts": 0,
-        "mutation_events": 0,
-        "opportunities_found": 0,
-        "arb_profit": 0.0,
-        "arb_latency": [],
-        "error_count": 0,
-        "abort_total": 0,
-    }
+    metrics.reset()
     yield
 
 
 def test_metrics_server(tmp_path):
     srv = metrics.MetricsServer(port=0)
     srv.start()
-    metrics._METRICS.update({
-        "opportunities": 0,
-        "fails": 0,
-        "pnl": 0.0,
-        "spreads": [],
-        "latencies": [],
-        "alert_count": 0,
-        "opportunities_found": 0,
-        "arb_profit": 0.0,
-        "arb_latency": [],
-        "error_count": 0,
-        "abort_total": 0,
-    })
 
     metrics.record_opportunity(0.1, 5.0, 0.5)
     metrics.record_fail()
@@ -67,6 +38,118 @@ def test_metrics_server(tmp_path):
     assert "error_count 1" in data
 
 
+def test_keep_alive_serves_repeated_scrapes():
+    import http.client
+
+    srv = metrics.MetricsServer(host="127.0.0.1", port=0)
+    srv.start()
+    host, port = srv.server.server_address
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        for _ in range(3):
+            conn.request("GET", "/metrics")
+            resp = conn.getresponse()
+            assert resp.status == 200
+            assert b"opportunities_total" in resp.read()
+        conn.request("GET", "/other")
+        resp = conn.getresponse()
+        assert resp.status == 404
+        resp.read()
+    finally:
+        srv.stop()
+        conn.close()
+
+
+def test_gzip_when_accepted():
+    import gzip
+
+    srv = metrics.MetricsServer(host="127.0.0.1", port=0)
+    srv.start()
+    host, port = srv.server.server_address
+    url = f"http://{host}:{port}/metrics"
+    try:
+        metrics.record_alert()
+        req = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+        resp = opener.open(req)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert b"alert_count 1" in gzip.decompress(resp.read())
+        assert "alert_count 1" in opener.open(url).read().decode()
+    finally:
+        srv.stop()
+
+
+def test_stop_with_open_keep_alive_client(caplog):
+    import socket
+    import threading
+
+    srv = metrics.MetricsServer(host="127.0.0.1", port=0)
+    srv.start()
+    host, port = srv.server.server_address
+    with socket.create_connection((host, port), timeout=5) as sock:
+        sock.sendall(b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+        assert sock.recv(4096).startswith(b"HTTP/1.1 200 OK")
+        stopper = threading.Thread(target=srv.stop)
+        stopper.start()
+        stopper.join(timeout=5)
+        assert not stopper.is_alive()
+        while sock.recv(4096):  # server closed the idle connection
+            pass
+    assert not [r for r in caplog.records if r.name == "asyncio"]
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_bad_content_length_rejected(length):
+    import socket
+
+    srv = metrics.MetricsServer(host="127.0.0.1", port=0)
+    srv.start()
+    host, port = srv.server.server_address
+    try:
+        with socket.create_connection((host, port), timeout=5) as sock:
+            sock.sendall(f"POST /metrics HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+            data = b""
+            while chunk := sock.recv(4096):
+                data += chunk
+        assert data.startswith(b"HTTP/1.1 400 Bad Request")
+        assert b"Connection: close" in data
+    finally:
+        srv.stop()
+
+
+def test_running_averages():
+    metrics.record_opportunity(0.1, 1.0, 0.2)
+    metrics.record_opportunity(0.3, 1.0, 0.4)
+    body = metrics._render_custom().decode()
+    values = dict(line.split(" ", 1) for line in body.splitlines())
+    assert float(values["avg_spread"]) == pytest.approx(0.2)
+    assert float(values["avg_latency_seconds"]) == pytest.approx(0.3)
+
+
+def test_cached_body_refreshes_after_update(monkeypatch):
+    monkeypatch.setattr(metrics, "_CACHE_TTL", 0.0)
+    srv = metrics.MetricsServer(port=0)
+    srv.start()
+    host, port = srv.server.server_address
+    url = f"http://{host}:{port}/metrics"
+    try:
+        metrics.record_alert()
+        assert "alert_count 1" in opener.open(url).read().decode()
+        assert "alert_count 1" in opener.open(url).read().decode()
+        metrics.record_alert()
+        assert "alert_count 2" in opener.open(url).read().decode()
+    finally:
+        srv.stop()
+
+
+def test_cached_body_ttl_floor(monkeypatch):
+    monkeypatch.setattr(metrics, "_CACHE_TTL", 60.0)
+    first = metrics._render_custom()
+    metrics.record_alert()
+    assert metrics._render_custom() is first
+    monkeypatch.setattr(metrics, "_CACHE_TTL", 0.0)
+    assert b"alert_count 1" in metrics._render_custom()
+
+
 def _start_server_with_token(monkeypatch, token):
     monkeypatch.setenv("METRICS_TOKEN", token)
     importlib.reload(metrics)
@@ -107,6 +190,78 @@ def test_error_count(monkeypatch, tmp_path):
 
     err_file = tmp_path / "err.log"
     monkeypatch.setenv("ERROR_LOG_FILE", str(err_file))
-    metrics._METRICS["error_count"] = 0
     log_error("test", "boom")
-    assert metrics._METRICS["error_count"] == 1
+    assert metrics._METRICS.error_count.value == 1
+
+
+def test_counter_concurrent_increments():
+    import threading
+
+    def work():
+        for _ in range(10000):
+            metrics.record_alert()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    counter = metrics._METRICS.alert_count
+    assert counter.value == 40000
+    assert counter.value == 40000
+
+
+def test_window_mean_is_bounded():
+    window = metrics._Window(size=3)
+    for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+        window.add(value)
+    assert len(window.values) == 3
+    assert window.mean() == pytest.approx(4.0)
+
+
+def test_shards_merged_across_threads():
+    import threading
+
+    def work():
+        for _ in range(100):
+            metrics.record_opportunity(0.1, 1.0, 0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    metrics.record_opportunity(0.1, 1.0, 0.5)
+    body = metrics._render_custom().decode()
+    values = dict(line.split(" ", 1) for line in body.splitlines())
+    assert float(values["pnl_total"]) == pytest.approx(401.0)
+    assert float(values["avg_arb_latency_seconds"]) == pytest.approx(0.5)
+    assert values["opportunities_total"] == "401"
+
+
+def test_strategy_scores_render_during_writes(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(metrics, "_CACHE_TTL", 0.0)
+    done = threading.Event()
+
+    def writer():
+        for i in range(20000):
+            metrics.record_strategy_score(f"s{i % 500}", float(i))
+        done.set()
+
+    t = threading.Thread(target=writer)
+    t.start()
+    while not done.is_set():
+        metrics._render_custom()
+    t.join()
+    body = metrics._render_custom().decode()
+    assert body.count("strategy_score{") == 500
+    assert 'strategy_score{strategy="s499"} 19999.0' in body
+
+
+def test_scoreboard_event_sets_decayed_score():
+    metrics.record_scoreboard_event(
+        strategy_id="s1", success_rate=0.5, total_profit=1.0, edge_decay=0.5, status="active"
+    )
+    assert metrics._METRICS.strategy_scores["s1"] == 0.25
@@ -0,0 +1,34 @@
+"""Tests for RPC node selection."""
+
+import pytest
+
+from core.node_selector import NodeSelector
+
+
+def test_best_prefers_low_latency_and_penalizes_failures():
+    sel = NodeSelector({"a": "http://a", "b": "http://b"})
+    assert sel.best() == "a"
+    sel.record("a", True, 0.2)
+    sel.record("b", True, 0.3)
+    assert sel.best() == "a"
+    sel.record("a", False, 0.2)
+    assert sel.best() == "b"
+
+
+def test_latency_is_exponentially_weighted():
+    sel = NodeSelector({"a": "http://a"}, alpha=0.5)
+    sel.record("a", True, 4.0)
+    assert sel.stats["a"]["ewma"] == 4.0
+    sel.record("a", True, 2.0)
+    sel.record("a", True, 1.0)
+    assert sel.stats["a"]["ewma"] == pytest.approx(2.0)
+
+
+def test_recent_latency_dominates():
+    sel = NodeSelector({"a": "http://a", "b": "http://b"})
+    for _ in range(1000):
+        sel.record("a", True, 5.0)
+        sel.record("b", True, 2.0)
+    for _ in range(100):
+        sel.record("a", True, 1.0)
+    assert sel.best() == "a"
@@ -0,0 +1,81 @@
+"""Tests for the pooled HTTP session shared by the oracle feeds."""
+
+import types
+
+import pytest
+
+import core.oracles._http as http
+import core.oracles.rwa_feed as rwa_feed
+
+
+class _Resp:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"price": 2.0, "fee": 0.1, "block": 7}
+
+
+class _Session:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.urls = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return _Resp()
+
+
+def test_feeds_reuse_one_session(monkeypatch):
+    fake = types.SimpleNamespace(Session=_Session)
+    monkeypatch.setattr(http, "requests", fake)
+    monkeypatch.setattr(rwa_feed, "requests", fake)
+    monkeypatch.setattr(http, "_SESSION", None)
+    _Session.created = 0
+    feed = rwa_feed.RWAFeed(base_url="http://rwa")
+    assert feed.fetch("TBILL", "a").price == 2.0
+    assert feed.fetch("TBILL", "b").block == 7
+    assert _Session.created == 1
+    assert http.session().urls == ["http://rwa/a/TBILL", "http://rwa/b/TBILL"]
+
+
+def test_decode_prefers_raw_content():
+    class R:
+        content = b'[{"intent_id": "i", "domain": "d", "action": "a", "price": 1.5}]'
+
+        def json(self):  # pragma: no cover - must not be used
+            raise AssertionError("resp.json() called")
+
+    if http.orjson is None:
+        pytest.skip("orjson not installed")
+    assert http.decode(R())[0]["price"] == 1.5
+
+
+def test_decode_falls_back_to_json():
+    class R:
+        def json(self):
+            return {"ok": True}
+
+    assert http.decode(R()) == {"ok": True}
+
+
+def test_intent_parse_rejects_bad_items(monkeypatch, tmp_path):
+    import core.oracles.intent_feed as intent_feed
+
+    monkeypatch.setenv("ERROR_LOG_FILE", str(tmp_path / "errors.log"))
+    items = [
+        {"intent_id": "1", "domain": "d", "action": "buy", "price": 1.0},
+        {"intent_id": "2", "domain": "d", "action": "buy"},
+        {"intent_id": "3", "domain": "d", "action": "buy", "price": 1.0, "x": 1},
+    ]
+    monkeypatch.setattr(intent_feed, "requests", object())
+    monkeypatch.setattr(intent_feed._http, "get", lambda url, timeout=5: _Resp())
+    monkeypatch.setattr(intent_feed._http, "decode", lambda resp: items)
+    intents = intent_feed.IntentFeed(base_url="http://i").fetch_intents("d")
+    assert [i.intent_id for i in intents] == ["1"]
+    assert (tmp_path / "errors.log").read_text().count('"parse"') == 2
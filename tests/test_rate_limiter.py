@@ -11,3 +11,26 @@ def test_rate_limit_waits():
     rl.wait()
     duration = time.monotonic() - start
     assert duration >= 0.5
+
+
+def test_concurrent_waiters_get_spaced_slots():
+    import threading
+
+    rl = RateLimiter(20)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        rl.wait()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # five slots 50ms apart: the last starts ~200ms after the first
+    assert max(stamps) - start >= 0.19
+    assert max(stamps) - start < 1.0
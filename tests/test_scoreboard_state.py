@@ -0,0 +1,92 @@
+"""Tests for StrategyScoreboard persistence and signal benchmarking."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from core import strategy_scoreboard as sb
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    path = tmp_path / "state" / "strategy_scoreboard.json"
+    monkeypatch.setattr(sb, "SCOREBOARD_STATE_FILE", path)
+    return path
+
+
+def _run(coro_fn):
+    # __init__ starts the collector tasks, so it needs a running loop
+    async def main():
+        board = sb.StrategyScoreboard()
+        try:
+            return await coro_fn(board)
+        finally:
+            await board.close()
+
+    return asyncio.run(main())
+
+
+async def _scores(board):
+    return dict(board.scores)
+
+
+def _signal(source, value):
+    return sb.MarketSignal(source, datetime.now(timezone.utc), value, 0.8, {})
+
+
+def test_update_only_marks_dirty_until_flush(state_file):
+    async def body(board):
+        board.update_strategy_score("s1", True, 0.5, 10.0)
+        assert board._dirty
+        assert not state_file.exists()
+        board.flush()
+        assert state_file.exists() and not board._dirty
+        board.update_strategy_score("s1", False, 0.0, 12.0, error=True)
+
+    _run(body)
+    # close() writes the pending update
+    reloaded = _run(_scores)["s1"]
+    assert reloaded.total_opportunities == 2
+    assert reloaded.error_count == 1
+
+
+def test_to_dict_round_trips_through_load_state(state_file):
+    async def body(board):
+        board.update_strategy_score("s1", True, 0.5, 10.0)
+        board.update_strategy_score("s2", False, 0.0, 20.0, error=True)
+        board.flush()
+        return dict(board.scores)
+
+    saved = _run(body)
+    loaded = _run(_scores)
+    assert loaded.keys() == saved.keys()
+    for sid, score in saved.items():
+        assert loaded[sid].to_dict() == score.to_dict()
+        assert loaded[sid].status is score.status
+        assert loaded[sid].effective_score == score.effective_score
+
+
+def test_benchmark_all_matches_per_strategy(state_file):
+    async def body(board):
+        board.update_strategy_score("s1", True, 0.5, 10.0)
+        board.update_strategy_score("s2", False, 0.0, 20.0)
+        board.market_signals.append(_signal(sb.SignalSource.WHALE_ALERT, 2.0))
+        board.market_signals.append(_signal(sb.SignalSource.DUNE_QUERY, 1.0))
+        every = board.benchmark_all()
+        assert every == {sid: board.benchmark_against_signals(sid) for sid in board.scores}
+        assert every["s1"]
+
+    _run(body)
+
+
+def test_signal_totals_cache_invalidated_on_append(state_file):
+    async def body(board):
+        board.update_strategy_score("s1", True, 0.5, 10.0)
+        board.market_signals.append(_signal(sb.SignalSource.WHALE_ALERT, 2.0))
+        first = board.benchmark_against_signals("s1")
+        assert set(first) == {"whale_alert"}
+        board.market_signals.append(_signal(sb.SignalSource.DUNE_QUERY, 1.0))
+        assert set(board.benchmark_against_signals("s1")) == {"whale_alert", "dune_query"}
+
+    _run(body)
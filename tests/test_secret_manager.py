@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from core import secret_manager
+from core.secret_manager import clear_secret_cache, get_secret
+
+
+def test_file_secret_cached_until_changed(monkeypatch, tmp_path):
+    clear_secret_cache()
+    secret = tmp_path / "key"
+    secret.write_text("one\n")
+    monkeypatch.setenv("API_KEY_FILE", str(secret))
+    reads = []
+    orig = secret_manager.Path.read_text
+
+    def counting(self, *a, **k):
+        reads.append(self)
+        return orig(self, *a, **k)
+
+    monkeypatch.setattr(secret_manager.Path, "read_text", counting)
+    assert get_secret("API_KEY") == "one"
+    assert get_secret("API_KEY") == "one"
+    assert len(reads) == 1
+
+    secret.write_text("rotated\n")
+    st = secret.stat()
+    os.utime(secret, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert get_secret("API_KEY") == "rotated"
+    assert len(reads) == 2
+
+
+def test_missing_file_falls_back_to_env(monkeypatch, tmp_path):
+    clear_secret_cache()
+    monkeypatch.setenv("API_KEY_FILE", str(tmp_path / "absent"))
+    monkeypatch.setenv("API_KEY", "from-env")
+    assert get_secret("API_KEY") == "from-env"
+    monkeypatch.delenv("API_KEY")
+    with pytest.raises(RuntimeError):
+        get_secret("API_KEY")
@@ -23,3 +23,38 @@ def test_auto_prune(tmp_path, monkeypatch):
     assert strat.disabled
     log_file = Path("logs/prune.log")
     assert log_file.exists()
+
+
+def test_auto_prune_async_writer(tmp_path, monkeypatch):
+    import json
+
+    from core import logger
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logger, "_ASYNC_LOG", True)
+    strat = Dummy(prune_epochs=1)
+    strat.record_result(False, -1.0)
+    assert logger.flush_logs()
+    entry = json.loads(Path("logs/prune.log").read_text())
+    assert entry == {"strategy": "dummy", "reason": "fail_threshold", "fail_count": 1}
+
+
+def test_validate_costs_follows_runtime_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GAS_COST_OVERRIDE", "1")
+    monkeypatch.setenv("SLIPPAGE_PCT", "0.1")
+    monkeypatch.setenv("CEX_FEE_PCT", "0.1")
+    strat = Dummy()
+    assert strat.validate_costs(2.0)  # 2.0 - (1 + 0.4) > 0
+    assert not strat.validate_costs(1.2)
+    monkeypatch.setenv("GAS_COST_OVERRIDE", "0")
+    assert strat.validate_costs(1.2)
+
+
+def test_pnl_history_bounded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PNL_HISTORY_MAX", "3")
+    strat = Dummy()
+    for pnl in range(5):
+        strat.record_result(True, float(pnl))
+    assert list(strat.performance.pnl_history) == [2.0, 3.0, 4.0]
@@ -117,3 +117,20 @@ def test_cross_agent_order_flow(tmp_path):
     assert nm.nonce_state().get("0xabc") == 1
     # next nonce should be 2
     assert nm.get_nonce("0xabc") == 2
+
+
+def test_async_log_flushed_on_kill(tmp_path, monkeypatch):
+    from core import logger
+
+    monkeypatch.setattr(logger, "_ASYNC_LOG", True)
+    web3 = DummyWeb3()
+    nm = NonceManager(web3, cache_file=str(tmp_path / "nonce.json"))
+    builder = TransactionBuilder(web3, nm, log_path=tmp_path / "log.json")
+    monkeypatch.setenv("KILL_SWITCH", "1")
+    monkeypatch.setenv("KILL_SWITCH_LOG_FILE", str(tmp_path / "kill.json"))
+    monkeypatch.setenv("ERROR_LOG_FILE", str(tmp_path / "errors.log"))
+    with pytest.raises(RuntimeError):
+        builder.send_transaction(HexBytes(b"\x01"), "0xdef")
+    # no explicit flush_logs(): the kill entry must already be on disk
+    entry = json.loads((tmp_path / "log.json").read_text())
+    assert entry["status"] == "killed"
@@ -0,0 +1,151 @@
+"""Tests for UniswapV3Feed RPC usage."""
+
+import time
+
+import pytest
+
+import core.oracles.uniswap_feed as uf
+
+T0 = "0x" + "11" * 20
+T1 = "0x" + "22" * 20
+
+
+def _words(*values):
+    return b"".join(v.to_bytes(32, "big") for v in values)
+
+
+class _Call:
+    def __init__(self, w3, name, value):
+        self.w3 = w3
+        self.name = name
+        self.value = value
+
+    def call(self):
+        self.w3.calls.append(self.name)
+        return self.value
+
+
+class _Functions:
+    def __init__(self, w3, address):
+        self.w3 = w3
+        self.address = address
+
+    def slot0(self):
+        return _Call(self.w3, "slot0", [2**96, 0, 0, 0, 0, 0, True])
+
+    def token0(self):
+        return _Call(self.w3, "token0", T0)
+
+    def token1(self):
+        return _Call(self.w3, "token1", T1)
+
+    def decimals(self):
+        return _Call(self.w3, f"decimals:{self.address}", 18)
+
+
+class _Contract:
+    def __init__(self, w3, address):
+        self.functions = _Functions(w3, address)
+
+
+class _MulticallFunctions:
+    def __init__(self, w3):
+        self.w3 = w3
+
+    def aggregate3(self, calls):
+        results = {
+            uf._SLOT0: _words(2**96, 0, 0, 0, 0, 0, 1),
+            uf._BLOCK_NUMBER: _words(1),
+            uf._BLOCK_TIMESTAMP: _words(int(time.time())),
+            uf._TOKEN0: _words(int(T0, 16)),
+            uf._TOKEN1: _words(int(T1, 16)),
+        }
+        self.w3.batched.append([data for _target, _allow, data in calls])
+        return _Call(self.w3, "aggregate3", [(True, results[data]) for _t, _a, data in calls])
+
+
+class _Multicall:
+    def __init__(self, w3):
+        self.functions = _MulticallFunctions(w3)
+
+
+class _Block:
+    number = 1
+
+    def __init__(self):
+        self.timestamp = int(time.time())
+
+
+class _Eth:
+    def __init__(self, w3):
+        self.w3 = w3
+
+    def get_code(self, address):
+        assert address == uf.MULTICALL3_ADDRESS
+        return self.w3.multicall_code
+
+    def contract(self, address, abi):
+        self.w3.contracts += 1
+        if address == uf.MULTICALL3_ADDRESS:
+            return _Multicall(self.w3)
+        return _Contract(self.w3, address)
+
+    def get_block(self, _tag):
+        self.w3.calls.append("get_block")
+        return _Block()
+
+
+class _Web3:
+    def __init__(self, multicall_code=b"\x60"):
+        self.calls = []
+        self.batched = []
+        self.contracts = 0
+        self.multicall_code = multicall_code
+        self.eth = _Eth(self)
+
+    @staticmethod
+    def to_checksum_address(value):
+        return "0x" + bytes(value).hex()
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    monkeypatch.setattr(uf, "Web3", object())
+    f = uf.UniswapV3Feed(rpc_urls={})
+    f.web3s = {"ethereum": _Web3()}
+    return f
+
+
+def test_fetch_price_is_one_multicall(feed):
+    first = feed.fetch_price("0xPOOL", "ethereum")
+    w3 = feed.web3s["ethereum"]
+    # tokens ride along on the first read, decimals are separate and cached
+    assert w3.calls == ["aggregate3", f"decimals:{T0}", f"decimals:{T1}"]
+    assert w3.batched[0] == [uf._SLOT0, uf._BLOCK_NUMBER, uf._BLOCK_TIMESTAMP, uf._TOKEN0, uf._TOKEN1]
+    w3.calls.clear()
+    second = feed.fetch_price("0xPOOL", "ethereum")
+    assert first.price == pytest.approx(1.0)
+    assert second.price == pytest.approx(1.0)
+    assert second.block == 1 and second.block_age <= 1
+    assert w3.calls == ["aggregate3"]
+    assert w3.batched[1] == [uf._SLOT0, uf._BLOCK_NUMBER, uf._BLOCK_TIMESTAMP]
+    # Multicall3 contract plus one ERC-20 contract per token, built once
+    assert w3.contracts == 3
+
+
+def test_fetch_price_without_multicall(feed):
+    w3 = feed.web3s["ethereum"] = _Web3(multicall_code=b"")
+    feed.fetch_price("0xPOOL", "ethereum")
+    w3.calls.clear()
+    data = feed.fetch_price("0xPOOL", "ethereum")
+    assert data.price == pytest.approx(1.0)
+    assert w3.calls == ["slot0", "get_block"]
+    # pool contract plus one ERC-20 contract per token, built once
+    assert w3.contracts == 3
+
+
+@pytest.mark.parametrize("dec0,dec1,expected", [(18, 6, 1e12), (6, 18, 1e-12), (18, 18, 1.0)])
+def test_fetch_price_scales_by_decimals(feed, monkeypatch, dec0, dec1, expected):
+    decimals = {T0: dec0, T1: dec1}
+    monkeypatch.setattr(feed, "_get_token_decimals", lambda w3, token: decimals[token])
+    assert feed.fetch_price("0xPOOL", "ethereum").price == pytest.approx(expected)
@@ -0,0 +1,29 @@
+import asyncio
+
+import ai.voting as voting
+from ai.voting import VoteType, VotingQuorum
+
+
+def _quorum(tmp_path, monkeypatch):
+    monkeypatch.setattr(voting, "VOTE_DIR", tmp_path)
+    vq = VotingQuorum(authorized_voters=["a", "b", "c"])
+    pid = vq.create_mutation_proposal("s", "prune", {"x": 1}, proposer="a")
+    return vq, pid
+
+
+def test_wait_for_quorum_wakes_on_deciding_vote(tmp_path, monkeypatch):
+    vq, pid = _quorum(tmp_path, monkeypatch)
+
+    async def run():
+        waiter = asyncio.create_task(vq.wait_for_quorum(pid, timeout=30))
+        await asyncio.sleep(0)
+        for voter in ("a", "b", "c"):
+            vq.cast_vote(pid, voter, VoteType.APPROVE)
+        return await asyncio.wait_for(waiter, timeout=1)
+
+    assert asyncio.run(run()) is True
+
+
+def test_wait_for_quorum_times_out(tmp_path, monkeypatch):
+    vq, pid = _quorum(tmp_path, monkeypatch)
+    assert asyncio.run(vq.wait_for_quorum(pid, timeout=0.01)) is False